@@ -1,4 +1,3 @@
-from collections import OrderedDict
 from inflection import underscore  # type: ignore
 import os
 import re
@@ -138,6 +137,44 @@ def get_optional(refs: FIXFieldRefs) -> t.List[str]:
     return [n for n, r in refs.items() if not r]
 
 
+def get_fix_types(
+    refs: t.Iterable[str],
+    fields: t.Dict[str, FIXField],
+) -> t.List[str]:
+    fix_types: t.List[str] = []
+    for name in refs:
+        fix_type = fields[name]["type"]
+        if fix_type not in fix_types:
+            fix_types.append(fix_type)
+    return fix_types
+
+
+def get_py_types(
+    refs: t.Iterable[str],
+    type_map: t.Dict[str, str],
+) -> t.Set[str]:
+    return {type_map[name] for name in refs}
+
+
+def get_data_lengths(
+    fields: t.Dict[str, FIXField],
+) -> t.Dict[str, str]:
+    """
+    Pair each DATA field with the LENGTH field that precedes it on
+    the wire, e.g. ``EncodedText`` with ``EncodedTextLen``.
+    """
+    lengths = {}
+    for name, field in fields.items():
+        if field["type"] != "DATA":
+            continue
+        for suffix in ("Len", "Length"):
+            length = fields.get(name + suffix)
+            if length is not None and length["type"] == "LENGTH":
+                lengths[name] = length["name"]
+                break
+    return lengths
+
+
 def convert_to_bool(val: str) -> bool:
     if val == "Y":
         return True
@@ -172,9 +209,9 @@ def get_fix_spec(path: str) -> "FIXSpec":
             fields: t.Optional[FIXFieldRefs] = None,
         ) -> FIXFieldRefs:
             if fields is None:
-                fields = OrderedDict()
+                fields = {}
             for c in elem.getchildren():
-                if c.tag != "field":
+                if c.tag not in ("field", "group"):
                     continue
 
                 name: str = c.get("name")
@@ -199,7 +236,7 @@ def get_fix_spec(path: str) -> "FIXSpec":
 
         msgs.append(msg)
 
-    fix_fields: t.Dict[str, FIXField] = OrderedDict()
+    fix_fields: t.Dict[str, FIXField] = {}
 
     for elem in field_tree:
         number = elem.get("number")
@@ -278,6 +315,29 @@ def render_cls_files(spec: FIXSpec, dir: str) -> None:
             type_map=spec["type_map"],
             get_required=get_required,
             get_optional=get_optional,
+            get_fix_types=get_fix_types,
+            get_py_types=get_py_types,
+            camel_to_snake=underscore,
+        ).dump(fn)
+
+
+def render_stub_files(spec: FIXSpec, dir: str) -> None:
+    with open(os.path.join(TEMPLATE_DIR, "msg_stub.txt"), "r") as f:
+        content = f.read()
+    template = jenv.from_string(content)
+    # LENGTH fields of DATA fields are appended with their data, so
+    # they get no ``append`` overload.
+    length_tags = set(get_data_lengths(spec["fields"]).values())
+    for msg in spec["messages"]:
+        fn = camel_to_snake(msg["name"]) + ".pyi"
+        fn = os.path.join(dir, fn)
+        template.stream(
+            msg=msg,
+            type_map=spec["type_map"],
+            length_tags=length_tags,
+            get_required=get_required,
+            get_optional=get_optional,
+            get_py_types=get_py_types,
             camel_to_snake=underscore,
         ).dump(fn)
 
@@ -289,6 +349,7 @@ def render_type_file(spec: FIXSpec, dir: str) -> None:
     fn = os.path.join(dir, "types.py")
     template.stream(
         spec=spec,
+        data_lengths=get_data_lengths(spec["fields"]),
     ).dump(fn)
 
 
@@ -314,7 +375,11 @@ def render_init_file(spec: FIXSpec, dir: str) -> None:
     ).dump(fn)
 
 
-def make_output_dir(path: str) -> None:
+def make_output_dir(path: str) -> bool:
+    """
+    Create the output package if needed. Returns `True` if a new
+    ``__init__.py`` was created.
+    """
     try:
         os.mkdir(path)
     except FileExistsError:
@@ -323,19 +388,30 @@ def make_output_dir(path: str) -> None:
     try:
         open(os.path.join(path, "__init__.py"), "x")
     except FileExistsError:
-        pass
+        return False
+    return True
 
 
-def generate(spec_path: str, dir: t.Optional[str] = None):
+def generate(
+    spec_path: str,
+    dir: t.Optional[str] = None,
+    name: t.Optional[str] = None,
+):
     if dir is None:
         dir = os.getcwd()
     spec = get_fix_spec(spec_path)
-    fn = os.path.basename(os.path.normpath(spec_path))
-    # TODO this is naive
-    spec_name = fn.split(".")[0]
-    dest = os.path.join(dir, spec_name)
-    make_output_dir(dest)
+    if name is None:
+        fn = os.path.basename(os.path.normpath(spec_path))
+        # TODO this is naive
+        name = fn.split(".")[0]
+    dest = os.path.join(dir, name)
+    is_new = make_output_dir(dest)
     render_type_file(spec, dest)
     render_data_file(spec, dest)
     render_cls_files(spec, dest)
-    render_init_file(spec, dest)
+    render_stub_files(spec, dest)
+    # Regenerating an existing package must not clobber its
+    # ``__init__.py``; the in-tree packages keep theirs empty so that
+    # importing one message does not import all of them.
+    if is_new:
+        render_init_file(spec, dest)
@@ -14,9 +14,15 @@ def get_args() -> argparse.Namespace:
         "--output",
         type=str
     )
+    parser.add_argument(
+        "-n",
+        "--name",
+        type=str,
+        help="name of the generated package, defaults to the spec name"
+    )
     return parser.parse_args()
 
 
 def run():
     args = get_args()
-    generate(args.spec_path[0], args.output)
+    generate(args.spec_path[0], args.output, args.name)
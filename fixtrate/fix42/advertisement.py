@@ -1,19 +1,64 @@
 import typing as t
-import typing_extensions as te
-from collections import OrderedDict
-import datetime as dt
 from decimal import Decimal
 
 from fixtrate.message import FixMessage
 from .types import FixTag as FT, TYPE_MAP
-from .validate import validate, convert, cast as _cast
+from .validate import validators, converters, get_appender, cast as _cast
+
+
+_convert_string = converters["STRING"]
+_convert_char = converters["CHAR"]
+_convert_qty = converters["QTY"]
+
+_APPENDERS = {
+    tag: get_appender(tag)
+    for tag in (
+        FT.AdvId,
+        FT.AdvTransType,
+        FT.AdvRefID,
+        FT.Symbol,
+        FT.SymbolSfx,
+        FT.SecurityID,
+        FT.IDSource,
+        FT.SecurityType,
+        FT.MaturityMonthYear,
+        FT.MaturityDay,
+        FT.PutOrCall,
+        FT.StrikePrice,
+        FT.OptAttribute,
+        FT.ContractMultiplier,
+        FT.CouponRate,
+        FT.SecurityExchange,
+        FT.Issuer,
+        FT.EncodedIssuerLen,
+        FT.EncodedIssuer,
+        FT.SecurityDesc,
+        FT.EncodedSecurityDescLen,
+        FT.EncodedSecurityDesc,
+        FT.AdvSide,
+        FT.Shares,
+        FT.Price,
+        FT.Currency,
+        FT.TradeDate,
+        FT.TransactTime,
+        FT.Text,
+        FT.EncodedTextLen,
+        FT.EncodedText,
+        FT.URLLink,
+        FT.LastMkt,
+        FT.TradingSessionID,
+    )
+}
 
 
 class Advertisement(FixMessage):
 
+    __slots__ = ()
+
     _msg_type = "7"
+    _msg_type_bytes = b"7"
 
-    _fields = OrderedDict({
+    _fields = {
         FT.AdvId: True,
         FT.AdvTransType: True,
         FT.AdvRefID: False,
@@ -48,7 +93,12 @@ class Advertisement(FixMessage):
         FT.URLLink: False,
         FT.LastMkt: False,
         FT.TradingSessionID: False,
-    })
+    }
+
+    _get_spec = {
+        tag: (is_required, validators[TYPE_MAP[tag]])
+        for tag, is_required in _fields.items()
+    }
 
     def __init__(
         self,
@@ -59,551 +109,44 @@ class Advertisement(FixMessage):
         shares: Decimal,
     ) -> None:
         super().__init__()
-        self.append_pair(35, self._msg_type)
-        self.append_pair(
-            FT.AdvId,
-            convert("STRING", adv_id),
-        )
-        self.append_pair(
-            FT.AdvTransType,
-            convert("STRING", adv_trans_type),
-        )
-        self.append_pair(
-            FT.Symbol,
-            convert("STRING", symbol),
-        )
-        self.append_pair(
-            FT.AdvSide,
-            convert("CHAR", adv_side),
-        )
-        self.append_pair(
-            FT.Shares,
-            convert("QTY", shares),
-        )
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.AdvId]) -> str:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.AdvTransType]) -> str:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.Symbol]) -> str:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.AdvSide]) -> str:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.Shares]) -> Decimal:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.AdvRefID]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.SymbolSfx]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.SecurityID]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.IDSource]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.SecurityType]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.MaturityMonthYear]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.MaturityDay]) -> t.Optional[int]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.PutOrCall]) -> t.Optional[int]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.StrikePrice]) -> t.Optional[Decimal]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.OptAttribute]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.ContractMultiplier]) -> t.Optional[float]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.CouponRate]) -> t.Optional[float]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.SecurityExchange]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.Issuer]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.EncodedIssuerLen]) -> t.Optional[int]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.EncodedIssuer]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.SecurityDesc]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.EncodedSecurityDescLen]) -> t.Optional[int]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.EncodedSecurityDesc]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.Price]) -> t.Optional[Decimal]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.Currency]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.TradeDate]) -> t.Optional[dt.date]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.TransactTime]) -> t.Optional[dt.datetime]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.Text]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.EncodedTextLen]) -> t.Optional[int]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.EncodedText]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.URLLink]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.LastMkt]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.TradingSessionID]) -> t.Optional[str]:
-        ...
-
-    def get(self, tag: FT):  # NOQA
-        is_required = self._fields[tag]
+        self.append_msg_type(self._msg_type_bytes)
+        self.extend_pairs((
+            (
+                b"2",
+                _convert_string(adv_id).encode(),
+            ),
+            (
+                b"5",
+                _convert_string(adv_trans_type).encode(),
+            ),
+            (
+                b"55",
+                _convert_string(symbol).encode(),
+            ),
+            (
+                b"4",
+                _convert_char(adv_side).encode(),
+            ),
+            (
+                b"53",
+                _convert_qty(shares).encode(),
+            ),
+        ))
+
+    def get(self, tag: FT):
+        is_required, validator = self._get_spec[tag]
         val = self.get_raw(tag)
         if val is None:
             if is_required:
                 raise ValueError
             return None
-        return validate(TYPE_MAP[tag], val)
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.AdvId],
-        val: str,
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.AdvTransType],
-        val: str,
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.AdvRefID],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.Symbol],
-        val: str,
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.SymbolSfx],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.SecurityID],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.IDSource],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.SecurityType],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.MaturityMonthYear],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.MaturityDay],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.PutOrCall],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.StrikePrice],
-        val: t.Optional[Decimal],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.OptAttribute],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.ContractMultiplier],
-        val: t.Optional[float],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.CouponRate],
-        val: t.Optional[float],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.SecurityExchange],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.Issuer],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.EncodedIssuerLen],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.EncodedIssuer],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.SecurityDesc],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.EncodedSecurityDescLen],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.EncodedSecurityDesc],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.AdvSide],
-        val: str,
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.Shares],
-        val: Decimal,
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.Price],
-        val: t.Optional[Decimal],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.Currency],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.TradeDate],
-        val: t.Optional[dt.date],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.TransactTime],
-        val: t.Optional[dt.datetime],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.Text],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.EncodedTextLen],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.EncodedText],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.URLLink],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.LastMkt],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.TradingSessionID],
-        val: t.Optional[str],
-    ) -> None:
-        ...
+        return validator(val)
 
-    def append(self, tag: FT, val: t.Any):  # NOQA
-        if tag is FT.AdvId:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.AdvTransType:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.AdvRefID:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.Symbol:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.SymbolSfx:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.SecurityID:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.IDSource:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.SecurityType:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.MaturityMonthYear:
-            assert isinstance(val, str)
-            converted = convert("MONTHYEAR", val)
-        elif tag is FT.MaturityDay:
-            assert isinstance(val, int)
-            converted = convert("DAYOFMONTH", val)
-        elif tag is FT.PutOrCall:
-            assert isinstance(val, int)
-            converted = convert("INT", val)
-        elif tag is FT.StrikePrice:
-            assert isinstance(val, Decimal)
-            converted = convert("PRICE", val)
-        elif tag is FT.OptAttribute:
-            assert isinstance(val, str)
-            converted = convert("CHAR", val)
-        elif tag is FT.ContractMultiplier:
-            assert isinstance(val, float)
-            converted = convert("FLOAT", val)
-        elif tag is FT.CouponRate:
-            assert isinstance(val, float)
-            converted = convert("FLOAT", val)
-        elif tag is FT.SecurityExchange:
-            assert isinstance(val, str)
-            converted = convert("EXCHANGE", val)
-        elif tag is FT.Issuer:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.EncodedIssuerLen:
-            assert isinstance(val, int)
-            converted = convert("LENGTH", val)
-        elif tag is FT.EncodedIssuer:
-            assert isinstance(val, str)
-            converted = convert("DATA", val)
-        elif tag is FT.SecurityDesc:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.EncodedSecurityDescLen:
-            assert isinstance(val, int)
-            converted = convert("LENGTH", val)
-        elif tag is FT.EncodedSecurityDesc:
-            assert isinstance(val, str)
-            converted = convert("DATA", val)
-        elif tag is FT.AdvSide:
-            assert isinstance(val, str)
-            converted = convert("CHAR", val)
-        elif tag is FT.Shares:
-            assert isinstance(val, Decimal)
-            converted = convert("QTY", val)
-        elif tag is FT.Price:
-            assert isinstance(val, Decimal)
-            converted = convert("PRICE", val)
-        elif tag is FT.Currency:
-            assert isinstance(val, str)
-            converted = convert("CURRENCY", val)
-        elif tag is FT.TradeDate:
-            assert isinstance(val, dt.date)
-            converted = convert("LOCALMKTDATE", val)
-        elif tag is FT.TransactTime:
-            assert isinstance(val, dt.datetime)
-            converted = convert("UTCTIMESTAMP", val)
-        elif tag is FT.Text:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.EncodedTextLen:
-            assert isinstance(val, int)
-            converted = convert("LENGTH", val)
-        elif tag is FT.EncodedText:
-            assert isinstance(val, str)
-            converted = convert("DATA", val)
-        elif tag is FT.URLLink:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.LastMkt:
-            assert isinstance(val, str)
-            converted = convert("EXCHANGE", val)
-        elif tag is FT.TradingSessionID:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        else:
+    def append(self, tag: FT, val: t.Any):
+        appender = _APPENDERS.get(tag)
+        if appender is None:
             raise ValueError(f"{tag} is not a valid FIX tag")
-        self.append_pair(tag, converted)
+        appender(self, val)
 
     @classmethod
     def cast(cls, msg: FixMessage) -> "Advertisement":
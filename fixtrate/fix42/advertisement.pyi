@@ -0,0 +1,410 @@
+import typing as t
+import typing_extensions as te
+import datetime as dt
+from decimal import Decimal
+
+from fixtrate.message import FixMessage
+from .types import FixTag as FT
+
+
+class Advertisement(FixMessage):
+    _msg_type: str
+    _msg_type_bytes: bytes
+
+    def __init__(
+        self,
+        adv_id: str,
+        adv_trans_type: str,
+        symbol: str,
+        adv_side: str,
+        shares: Decimal,
+    ) -> None:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.AdvId]) -> str:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.AdvTransType]) -> str:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.Symbol]) -> str:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.AdvSide]) -> str:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.Shares]) -> Decimal:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.AdvRefID]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.SymbolSfx]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.SecurityID]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.IDSource]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.SecurityType]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.MaturityMonthYear]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.MaturityDay]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.PutOrCall]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.StrikePrice]) -> t.Optional[Decimal]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.OptAttribute]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.ContractMultiplier]) -> t.Optional[float]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.CouponRate]) -> t.Optional[float]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.SecurityExchange]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.Issuer]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.EncodedIssuerLen]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.EncodedIssuer]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.SecurityDesc]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.EncodedSecurityDescLen]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.EncodedSecurityDesc]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.Price]) -> t.Optional[Decimal]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.Currency]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.TradeDate]) -> t.Optional[dt.date]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.TransactTime]) -> t.Optional[dt.datetime]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.Text]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.EncodedTextLen]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.EncodedText]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.URLLink]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.LastMkt]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.TradingSessionID]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.AdvId],
+        val: str,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.AdvTransType],
+        val: str,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.AdvRefID],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.Symbol],
+        val: str,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.SymbolSfx],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.SecurityID],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.IDSource],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.SecurityType],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.MaturityMonthYear],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.MaturityDay],
+        val: t.Optional[int],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.PutOrCall],
+        val: t.Optional[int],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.StrikePrice],
+        val: t.Optional[Decimal],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.OptAttribute],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.ContractMultiplier],
+        val: t.Optional[float],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.CouponRate],
+        val: t.Optional[float],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.SecurityExchange],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.Issuer],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.EncodedIssuer],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.SecurityDesc],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.EncodedSecurityDesc],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.AdvSide],
+        val: str,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.Shares],
+        val: Decimal,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.Price],
+        val: t.Optional[Decimal],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.Currency],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.TradeDate],
+        val: t.Optional[dt.date],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.TransactTime],
+        val: t.Optional[dt.datetime],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.Text],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.EncodedText],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.URLLink],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.LastMkt],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.TradingSessionID],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @classmethod
+    def cast(cls, msg: FixMessage) -> "Advertisement":
+        ...
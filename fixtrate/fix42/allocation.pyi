@@ -0,0 +1,969 @@
+import typing as t
+import typing_extensions as te
+import datetime as dt
+from decimal import Decimal
+
+from fixtrate.message import FixMessage
+from .types import FixTag as FT
+
+
+class Allocation(FixMessage):
+    _msg_type: str
+    _msg_type_bytes: bytes
+
+    def __init__(
+        self,
+        alloc_id: str,
+        alloc_trans_type: str,
+        side: str,
+        symbol: str,
+        shares: Decimal,
+        avg_px: Decimal,
+        trade_date: dt.date,
+        alloc_shares: Decimal,
+    ) -> None:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.AllocID]) -> str:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.AllocTransType]) -> str:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.Side]) -> str:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.Symbol]) -> str:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.Shares]) -> Decimal:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.AvgPx]) -> Decimal:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.TradeDate]) -> dt.date:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.AllocShares]) -> Decimal:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.RefAllocID]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.AllocLinkID]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.AllocLinkType]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.NoOrders]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.ClOrdID]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.OrderID]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.SecondaryOrderID]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.ListID]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.WaveNo]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.NoExecs]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.LastShares]) -> t.Optional[Decimal]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.ExecID]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.LastPx]) -> t.Optional[Decimal]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.LastCapacity]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.SymbolSfx]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.SecurityID]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.IDSource]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.SecurityType]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.MaturityMonthYear]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.MaturityDay]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.PutOrCall]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.StrikePrice]) -> t.Optional[Decimal]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.OptAttribute]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.ContractMultiplier]) -> t.Optional[float]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.CouponRate]) -> t.Optional[float]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.SecurityExchange]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.Issuer]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.EncodedIssuerLen]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.EncodedIssuer]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.SecurityDesc]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.EncodedSecurityDescLen]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.EncodedSecurityDesc]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.LastMkt]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.TradingSessionID]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.Currency]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.AvgPrxPrecision]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.TransactTime]) -> t.Optional[dt.datetime]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.SettlmntTyp]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.FutSettDate]) -> t.Optional[dt.date]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.GrossTradeAmt]) -> t.Optional[Decimal]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.NetMoney]) -> t.Optional[Decimal]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.OpenClose]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.Text]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.EncodedTextLen]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.EncodedText]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.NumDaysInterest]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.AccruedInterestRate]) -> t.Optional[float]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.NoAllocs]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.AllocAccount]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.AllocPrice]) -> t.Optional[Decimal]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.ProcessCode]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.BrokerOfCredit]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.NotifyBrokerOfCredit]) -> t.Optional[bool]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.AllocHandlInst]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.AllocText]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.EncodedAllocTextLen]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.EncodedAllocText]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.ExecBroker]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.ClientID]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.Commission]) -> t.Optional[Decimal]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.CommType]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.AllocAvgPx]) -> t.Optional[Decimal]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.AllocNetMoney]) -> t.Optional[Decimal]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.SettlCurrAmt]) -> t.Optional[Decimal]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.SettlCurrency]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.SettlCurrFxRate]) -> t.Optional[float]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.SettlCurrFxRateCalc]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.AccruedInterestAmt]) -> t.Optional[Decimal]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.SettlInstMode]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.NoMiscFees]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.MiscFeeAmt]) -> t.Optional[Decimal]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.MiscFeeCurr]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.MiscFeeType]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.AllocID],
+        val: str,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.AllocTransType],
+        val: str,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.RefAllocID],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.AllocLinkID],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.AllocLinkType],
+        val: t.Optional[int],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.NoOrders],
+        val: t.Optional[int],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.ClOrdID],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.OrderID],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.SecondaryOrderID],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.ListID],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.WaveNo],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.NoExecs],
+        val: t.Optional[int],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.LastShares],
+        val: t.Optional[Decimal],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.ExecID],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.LastPx],
+        val: t.Optional[Decimal],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.LastCapacity],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.Side],
+        val: str,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.Symbol],
+        val: str,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.SymbolSfx],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.SecurityID],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.IDSource],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.SecurityType],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.MaturityMonthYear],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.MaturityDay],
+        val: t.Optional[int],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.PutOrCall],
+        val: t.Optional[int],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.StrikePrice],
+        val: t.Optional[Decimal],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.OptAttribute],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.ContractMultiplier],
+        val: t.Optional[float],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.CouponRate],
+        val: t.Optional[float],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.SecurityExchange],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.Issuer],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.EncodedIssuer],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.SecurityDesc],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.EncodedSecurityDesc],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.Shares],
+        val: Decimal,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.LastMkt],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.TradingSessionID],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.AvgPx],
+        val: Decimal,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.Currency],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.AvgPrxPrecision],
+        val: t.Optional[int],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.TradeDate],
+        val: dt.date,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.TransactTime],
+        val: t.Optional[dt.datetime],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.SettlmntTyp],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.FutSettDate],
+        val: t.Optional[dt.date],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.GrossTradeAmt],
+        val: t.Optional[Decimal],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.NetMoney],
+        val: t.Optional[Decimal],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.OpenClose],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.Text],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.EncodedText],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.NumDaysInterest],
+        val: t.Optional[int],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.AccruedInterestRate],
+        val: t.Optional[float],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.NoAllocs],
+        val: t.Optional[int],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.AllocAccount],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.AllocPrice],
+        val: t.Optional[Decimal],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.AllocShares],
+        val: Decimal,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.ProcessCode],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.BrokerOfCredit],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.NotifyBrokerOfCredit],
+        val: t.Optional[bool],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.AllocHandlInst],
+        val: t.Optional[int],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.AllocText],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.EncodedAllocText],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.ExecBroker],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.ClientID],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.Commission],
+        val: t.Optional[Decimal],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.CommType],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.AllocAvgPx],
+        val: t.Optional[Decimal],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.AllocNetMoney],
+        val: t.Optional[Decimal],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.SettlCurrAmt],
+        val: t.Optional[Decimal],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.SettlCurrency],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.SettlCurrFxRate],
+        val: t.Optional[float],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.SettlCurrFxRateCalc],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.AccruedInterestAmt],
+        val: t.Optional[Decimal],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.SettlInstMode],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.NoMiscFees],
+        val: t.Optional[int],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.MiscFeeAmt],
+        val: t.Optional[Decimal],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.MiscFeeCurr],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.MiscFeeType],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @classmethod
+    def cast(cls, msg: FixMessage) -> "Allocation":
+        ...
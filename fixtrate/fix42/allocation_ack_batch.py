@@ -0,0 +1,56 @@
+import datetime as dt
+import typing as t
+
+from fixtrate.message import FixMessage
+from .allocation_instruction_ack import AllocationInstructionAck
+from .types import FixTag as FT, TAG_BYTES
+from .validate import converters
+
+
+def build_many(
+    alloc_ids: t.Sequence[str],
+    trade_dates: t.Sequence[dt.date],
+    alloc_statuses: t.Sequence[int],
+) -> t.List[AllocationInstructionAck]:
+    """
+    Build one :class:`AllocationInstructionAck` per ``(alloc_id,
+    trade_date, alloc_status)`` triple.
+
+    Equivalent to calling the constructor in a loop, but the
+    converters are resolved once for the whole batch and each
+    distinct trade date is only formatted once, which is what
+    dominates replay and backtesting workloads.
+    """
+    if not len(alloc_ids) == len(trade_dates) == len(alloc_statuses):
+        raise ValueError(
+            "alloc_ids, trade_dates and alloc_statuses "
+            "must have the same length"
+        )
+
+    convert_id = converters["STRING"]
+    convert_date = converters["LOCALMKTDATE"]
+    convert_status = converters["INT"]
+    msg_type = AllocationInstructionAck._msg_type_bytes
+    alloc_id_tag = TAG_BYTES[FT.AllocID]
+    trade_date_tag = TAG_BYTES[FT.TradeDate]
+    alloc_status_tag = TAG_BYTES[FT.AllocStatus]
+    dates: t.Dict[dt.date, bytes] = {}
+
+    msgs = []
+    for alloc_id, trade_date, alloc_status in zip(
+        alloc_ids, trade_dates, alloc_statuses
+    ):
+        converted_date = dates.get(trade_date)
+        if converted_date is None:
+            converted_date = convert_date(trade_date).encode()
+            dates[trade_date] = converted_date
+        msg = AllocationInstructionAck.__new__(AllocationInstructionAck)
+        FixMessage.__init__(msg)
+        msg.append_msg_type(msg_type)
+        msg.extend_pairs((
+            (alloc_id_tag, convert_id(alloc_id).encode()),
+            (trade_date_tag, converted_date),
+            (alloc_status_tag, convert_status(alloc_status).encode()),
+        ))
+        msgs.append(msg)
+    return msgs
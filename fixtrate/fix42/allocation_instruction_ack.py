@@ -1,19 +1,40 @@
 import typing as t
-import typing_extensions as te
-from collections import OrderedDict
 import datetime as dt
-from decimal import Decimal
 
 from fixtrate.message import FixMessage
 from .types import FixTag as FT, TYPE_MAP
-from .validate import validate, convert, cast as _cast
+from .validate import validators, converters, get_appender, cast as _cast
+
+
+_convert_string = converters["STRING"]
+_convert_localmktdate = converters["LOCALMKTDATE"]
+_convert_int = converters["INT"]
+
+_APPENDERS = {
+    tag: get_appender(tag)
+    for tag in (
+        FT.ClientID,
+        FT.ExecBroker,
+        FT.AllocID,
+        FT.TradeDate,
+        FT.TransactTime,
+        FT.AllocStatus,
+        FT.AllocRejCode,
+        FT.Text,
+        FT.EncodedTextLen,
+        FT.EncodedText,
+    )
+}
 
 
 class AllocationInstructionAck(FixMessage):
 
+    __slots__ = ()
+
     _msg_type = "P"
+    _msg_type_bytes = b"P"
 
-    _fields = OrderedDict({
+    _fields = {
         FT.ClientID: False,
         FT.ExecBroker: False,
         FT.AllocID: True,
@@ -24,7 +45,12 @@ class AllocationInstructionAck(FixMessage):
         FT.Text: False,
         FT.EncodedTextLen: False,
         FT.EncodedText: False,
-    })
+    }
+
+    _get_spec = {
+        tag: (is_required, validators[TYPE_MAP[tag]])
+        for tag, is_required in _fields.items()
+    }
 
     def __init__(
         self,
@@ -33,183 +59,36 @@ class AllocationInstructionAck(FixMessage):
         alloc_status: int,
     ) -> None:
         super().__init__()
-        self.append_pair(35, self._msg_type)
-        self.append_pair(
-            FT.AllocID,
-            convert("STRING", alloc_id),
-        )
-        self.append_pair(
-            FT.TradeDate,
-            convert("LOCALMKTDATE", trade_date),
-        )
-        self.append_pair(
-            FT.AllocStatus,
-            convert("INT", alloc_status),
-        )
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.AllocID]) -> str:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.TradeDate]) -> dt.date:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.AllocStatus]) -> int:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.ClientID]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.ExecBroker]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.TransactTime]) -> t.Optional[dt.datetime]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.AllocRejCode]) -> t.Optional[int]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.Text]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.EncodedTextLen]) -> t.Optional[int]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.EncodedText]) -> t.Optional[str]:
-        ...
-
-    def get(self, tag: FT):  # NOQA
-        is_required = self._fields[tag]
+        self.append_msg_type(self._msg_type_bytes)
+        self.extend_pairs((
+            (
+                b"70",
+                _convert_string(alloc_id).encode(),
+            ),
+            (
+                b"75",
+                _convert_localmktdate(trade_date).encode(),
+            ),
+            (
+                b"87",
+                _convert_int(alloc_status).encode(),
+            ),
+        ))
+
+    def get(self, tag: FT):
+        is_required, validator = self._get_spec[tag]
         val = self.get_raw(tag)
         if val is None:
             if is_required:
                 raise ValueError
             return None
-        return validate(TYPE_MAP[tag], val)
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.ClientID],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.ExecBroker],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.AllocID],
-        val: str,
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.TradeDate],
-        val: dt.date,
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.TransactTime],
-        val: t.Optional[dt.datetime],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.AllocStatus],
-        val: int,
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.AllocRejCode],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.Text],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.EncodedTextLen],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.EncodedText],
-        val: t.Optional[str],
-    ) -> None:
-        ...
+        return validator(val)
 
-    def append(self, tag: FT, val: t.Any):  # NOQA
-        if tag is FT.ClientID:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.ExecBroker:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.AllocID:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.TradeDate:
-            assert isinstance(val, dt.date)
-            converted = convert("LOCALMKTDATE", val)
-        elif tag is FT.TransactTime:
-            assert isinstance(val, dt.datetime)
-            converted = convert("UTCTIMESTAMP", val)
-        elif tag is FT.AllocStatus:
-            assert isinstance(val, int)
-            converted = convert("INT", val)
-        elif tag is FT.AllocRejCode:
-            assert isinstance(val, int)
-            converted = convert("INT", val)
-        elif tag is FT.Text:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.EncodedTextLen:
-            assert isinstance(val, int)
-            converted = convert("LENGTH", val)
-        elif tag is FT.EncodedText:
-            assert isinstance(val, str)
-            converted = convert("DATA", val)
-        else:
+    def append(self, tag: FT, val: t.Any):
+        appender = _APPENDERS.get(tag)
+        if appender is None:
             raise ValueError(f"{tag} is not a valid FIX tag")
-        self.append_pair(tag, converted)
+        appender(self, val)
 
     @classmethod
     def cast(cls, msg: FixMessage) -> "AllocationInstructionAck":
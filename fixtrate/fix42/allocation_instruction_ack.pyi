@@ -0,0 +1,135 @@
+import typing as t
+import typing_extensions as te
+import datetime as dt
+
+from fixtrate.message import FixMessage
+from .types import FixTag as FT
+
+
+class AllocationInstructionAck(FixMessage):
+    _msg_type: str
+    _msg_type_bytes: bytes
+
+    def __init__(
+        self,
+        alloc_id: str,
+        trade_date: dt.date,
+        alloc_status: int,
+    ) -> None:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.AllocID]) -> str:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.TradeDate]) -> dt.date:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.AllocStatus]) -> int:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.ClientID]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.ExecBroker]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.TransactTime]) -> t.Optional[dt.datetime]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.AllocRejCode]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.Text]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.EncodedTextLen]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.EncodedText]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.ClientID],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.ExecBroker],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.AllocID],
+        val: str,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.TradeDate],
+        val: dt.date,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.TransactTime],
+        val: t.Optional[dt.datetime],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.AllocStatus],
+        val: int,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.AllocRejCode],
+        val: t.Optional[int],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.Text],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.EncodedText],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @classmethod
+    def cast(cls, msg: FixMessage) -> "AllocationInstructionAck":
+        ...
@@ -0,0 +1,583 @@
+import typing as t
+import typing_extensions as te
+import datetime as dt
+from decimal import Decimal
+
+from fixtrate.message import FixMessage
+from .types import FixTag as FT
+
+
+class BidRequest(FixMessage):
+    _msg_type: str
+    _msg_type_bytes: bytes
+
+    def __init__(
+        self,
+        client_bid_id: str,
+        bid_request_trans_type: str,
+        total_num_securities: int,
+        bid_type: int,
+        trade_type: str,
+        basis_px_type: str,
+    ) -> None:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.ClientBidID]) -> str:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.BidRequestTransType]) -> str:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.TotalNumSecurities]) -> int:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.BidType]) -> int:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.TradeType]) -> str:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.BasisPxType]) -> str:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.BidID]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.ListName]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.NumTickets]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.Currency]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.SideValue1]) -> t.Optional[Decimal]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.SideValue2]) -> t.Optional[Decimal]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.NoBidDescriptors]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.BidDescriptorType]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.BidDescriptor]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.SideValueInd]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.LiquidityValue]) -> t.Optional[Decimal]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.LiquidityNumSecurities]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.LiquidityPctLow]) -> t.Optional[float]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.LiquidityPctHigh]) -> t.Optional[float]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.EFPTrackingError]) -> t.Optional[float]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.FairValue]) -> t.Optional[Decimal]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.OutsideIndexPct]) -> t.Optional[float]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.ValueOfFutures]) -> t.Optional[Decimal]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.NoBidComponents]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.ListID]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.Side]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.TradingSessionID]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.NetGrossInd]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.SettlmntTyp]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.FutSettDate]) -> t.Optional[dt.date]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.Account]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.LiquidityIndType]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.WtAverageLiquidity]) -> t.Optional[float]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.ExchangeForPhysical]) -> t.Optional[bool]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.OutMainCntryUIndex]) -> t.Optional[Decimal]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.CrossPercent]) -> t.Optional[float]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.ProgRptReqs]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.ProgPeriodInterval]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.IncTaxInd]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.ForexReq]) -> t.Optional[bool]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.NumBidders]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.TradeDate]) -> t.Optional[dt.date]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.StrikeTime]) -> t.Optional[dt.datetime]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.Text]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.EncodedTextLen]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.EncodedText]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.BidID],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.ClientBidID],
+        val: str,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.BidRequestTransType],
+        val: str,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.ListName],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.TotalNumSecurities],
+        val: int,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.BidType],
+        val: int,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.NumTickets],
+        val: t.Optional[int],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.Currency],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.SideValue1],
+        val: t.Optional[Decimal],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.SideValue2],
+        val: t.Optional[Decimal],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.NoBidDescriptors],
+        val: t.Optional[int],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.BidDescriptorType],
+        val: t.Optional[int],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.BidDescriptor],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.SideValueInd],
+        val: t.Optional[int],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.LiquidityValue],
+        val: t.Optional[Decimal],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.LiquidityNumSecurities],
+        val: t.Optional[int],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.LiquidityPctLow],
+        val: t.Optional[float],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.LiquidityPctHigh],
+        val: t.Optional[float],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.EFPTrackingError],
+        val: t.Optional[float],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.FairValue],
+        val: t.Optional[Decimal],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.OutsideIndexPct],
+        val: t.Optional[float],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.ValueOfFutures],
+        val: t.Optional[Decimal],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.NoBidComponents],
+        val: t.Optional[int],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.ListID],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.Side],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.TradingSessionID],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.NetGrossInd],
+        val: t.Optional[int],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.SettlmntTyp],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.FutSettDate],
+        val: t.Optional[dt.date],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.Account],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.LiquidityIndType],
+        val: t.Optional[int],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.WtAverageLiquidity],
+        val: t.Optional[float],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.ExchangeForPhysical],
+        val: t.Optional[bool],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.OutMainCntryUIndex],
+        val: t.Optional[Decimal],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.CrossPercent],
+        val: t.Optional[float],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.ProgRptReqs],
+        val: t.Optional[int],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.ProgPeriodInterval],
+        val: t.Optional[int],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.IncTaxInd],
+        val: t.Optional[int],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.ForexReq],
+        val: t.Optional[bool],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.NumBidders],
+        val: t.Optional[int],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.TradeDate],
+        val: t.Optional[dt.date],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.TradeType],
+        val: str,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.BasisPxType],
+        val: str,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.StrikeTime],
+        val: t.Optional[dt.datetime],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.Text],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.EncodedText],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @classmethod
+    def cast(cls, msg: FixMessage) -> "BidRequest":
+        ...
@@ -0,0 +1,232 @@
+import typing as t
+import typing_extensions as te
+import datetime as dt
+from decimal import Decimal
+
+from fixtrate.message import FixMessage
+from .types import FixTag as FT
+
+
+class BidResponse(FixMessage):
+    _msg_type: str
+    _msg_type_bytes: bytes
+
+    def __init__(
+        self,
+        no_bid_components: int,
+        commission: Decimal,
+        comm_type: str,
+    ) -> None:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.NoBidComponents]) -> int:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.Commission]) -> Decimal:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.CommType]) -> str:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.BidID]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.ClientBidID]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.ListID]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.Country]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.Side]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.Price]) -> t.Optional[Decimal]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.PriceType]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.FairValue]) -> t.Optional[Decimal]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.NetGrossInd]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.SettlmntTyp]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.FutSettDate]) -> t.Optional[dt.date]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.TradingSessionID]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.Text]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.EncodedTextLen]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.EncodedText]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.BidID],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.ClientBidID],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.NoBidComponents],
+        val: int,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.Commission],
+        val: Decimal,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.CommType],
+        val: str,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.ListID],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.Country],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.Side],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.Price],
+        val: t.Optional[Decimal],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.PriceType],
+        val: t.Optional[int],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.FairValue],
+        val: t.Optional[Decimal],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.NetGrossInd],
+        val: t.Optional[int],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.SettlmntTyp],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.FutSettDate],
+        val: t.Optional[dt.date],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.TradingSessionID],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.Text],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.EncodedText],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @classmethod
+    def cast(cls, msg: FixMessage) -> "BidResponse":
+        ...
@@ -0,0 +1,60 @@
+from decimal import Decimal
+import typing as t
+
+from fixtrate.message import FixMessage
+from .bid_response import BidResponse
+from .types import FixTag as FT, TAG_BYTES
+from .validate import converters
+
+
+def build_bid_response(
+    commissions: t.Sequence[Decimal],
+    comm_types: t.Sequence[str],
+    sides: t.Optional[t.Sequence[str]] = None,
+    prices: t.Optional[t.Sequence[Decimal]] = None,
+) -> BidResponse:
+    """
+    Build a :class:`BidResponse` with one NoBidComponents<420> entry
+    per item of ``commissions``.
+
+    ``commissions`` must not be empty, since Commission<12> and
+    CommType<13> are required in each entry. The optional ``sides``
+    and ``prices`` columns must be the same length as
+    ``commissions``. Each column is converted in one pass before the
+    component pairs are interleaved into the message, so large bid
+    lists avoid the per-field dispatch of ``append``.
+    """
+    count = len(commissions)
+    if not count:
+        raise ValueError("At least one bid component is required")
+    columns = [
+        (FT.Commission, "AMT", commissions),
+        (FT.CommType, "CHAR", comm_types),
+        (FT.Side, "CHAR", sides),
+        (FT.Price, "PRICE", prices),
+    ]
+
+    encoded = []
+    for tag, fix_type, values in columns:
+        if values is None:
+            continue
+        if len(values) != count:
+            raise ValueError(
+                f"Expected {count} values for {tag.name}, "
+                f"got {len(values)}"
+            )
+        convert = converters[fix_type]
+        encoded.append(
+            (TAG_BYTES[tag], [convert(val).encode() for val in values])
+        )
+
+    msg = BidResponse.__new__(BidResponse)
+    FixMessage.__init__(msg)
+    msg.append_msg_type(BidResponse._msg_type_bytes)
+    msg.append_raw(TAG_BYTES[FT.NoBidComponents], str(count).encode())
+    msg.extend_pairs(
+        (tag_bytes, column[i])
+        for i in range(count)
+        for tag_bytes, column in encoded
+    )
+    return msg
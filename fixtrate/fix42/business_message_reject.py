@@ -1,19 +1,35 @@
 import typing as t
-import typing_extensions as te
-from collections import OrderedDict
-import datetime as dt
-from decimal import Decimal
 
 from fixtrate.message import FixMessage
 from .types import FixTag as FT, TYPE_MAP
-from .validate import validate, convert, cast as _cast
+from .validate import validators, converters, get_appender, cast as _cast
+
+
+_convert_string = converters["STRING"]
+_convert_int = converters["INT"]
+
+_APPENDERS = {
+    tag: get_appender(tag)
+    for tag in (
+        FT.RefSeqNum,
+        FT.RefMsgType,
+        FT.BusinessRejectRefID,
+        FT.BusinessRejectReason,
+        FT.Text,
+        FT.EncodedTextLen,
+        FT.EncodedText,
+    )
+}
 
 
 class BusinessMessageReject(FixMessage):
 
+    __slots__ = ()
+
     _msg_type = "j"
+    _msg_type_bytes = b"j"
 
-    _fields = OrderedDict({
+    _fields = {
         FT.RefSeqNum: False,
         FT.RefMsgType: True,
         FT.BusinessRejectRefID: False,
@@ -21,7 +37,12 @@ class BusinessMessageReject(FixMessage):
         FT.Text: False,
         FT.EncodedTextLen: False,
         FT.EncodedText: False,
-    })
+    }
+
+    _get_spec = {
+        tag: (is_required, validators[TYPE_MAP[tag]])
+        for tag, is_required in _fields.items()
+    }
 
     def __init__(
         self,
@@ -29,134 +50,32 @@ class BusinessMessageReject(FixMessage):
         business_reject_reason: int,
     ) -> None:
         super().__init__()
-        self.append_pair(35, self._msg_type)
-        self.append_pair(
-            FT.RefMsgType,
-            convert("STRING", ref_msg_type),
-        )
-        self.append_pair(
-            FT.BusinessRejectReason,
-            convert("INT", business_reject_reason),
-        )
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.RefMsgType]) -> str:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.BusinessRejectReason]) -> int:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.RefSeqNum]) -> t.Optional[int]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.BusinessRejectRefID]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.Text]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.EncodedTextLen]) -> t.Optional[int]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.EncodedText]) -> t.Optional[str]:
-        ...
-
-    def get(self, tag: FT):  # NOQA
-        is_required = self._fields[tag]
+        self.append_msg_type(self._msg_type_bytes)
+        self.extend_pairs((
+            (
+                b"372",
+                _convert_string(ref_msg_type).encode(),
+            ),
+            (
+                b"380",
+                _convert_int(business_reject_reason).encode(),
+            ),
+        ))
+
+    def get(self, tag: FT):
+        is_required, validator = self._get_spec[tag]
         val = self.get_raw(tag)
         if val is None:
             if is_required:
                 raise ValueError
             return None
-        return validate(TYPE_MAP[tag], val)
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.RefSeqNum],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.RefMsgType],
-        val: str,
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.BusinessRejectRefID],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.BusinessRejectReason],
-        val: int,
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.Text],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.EncodedTextLen],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.EncodedText],
-        val: t.Optional[str],
-    ) -> None:
-        ...
+        return validator(val)
 
-    def append(self, tag: FT, val: t.Any):  # NOQA
-        if tag is FT.RefSeqNum:
-            assert isinstance(val, int)
-            converted = convert("INT", val)
-        elif tag is FT.RefMsgType:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.BusinessRejectRefID:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.BusinessRejectReason:
-            assert isinstance(val, int)
-            converted = convert("INT", val)
-        elif tag is FT.Text:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.EncodedTextLen:
-            assert isinstance(val, int)
-            converted = convert("LENGTH", val)
-        elif tag is FT.EncodedText:
-            assert isinstance(val, str)
-            converted = convert("DATA", val)
-        else:
+    def append(self, tag: FT, val: t.Any):
+        appender = _APPENDERS.get(tag)
+        if appender is None:
             raise ValueError(f"{tag} is not a valid FIX tag")
-        self.append_pair(tag, converted)
+        appender(self, val)
 
     @classmethod
     def cast(cls, msg: FixMessage) -> "BusinessMessageReject":
@@ -1,19 +1,58 @@
 import typing as t
-import typing_extensions as te
-from collections import OrderedDict
-import datetime as dt
-from decimal import Decimal
 
 from fixtrate.message import FixMessage
 from .types import FixTag as FT, TYPE_MAP
-from .validate import validate, convert, cast as _cast
+from .validate import validators, converters, get_appender, cast as _cast
+
+
+_convert_string = converters["STRING"]
+_convert_char = converters["CHAR"]
+
+_APPENDERS = {
+    tag: get_appender(tag)
+    for tag in (
+        FT.OrderID,
+        FT.ExecID,
+        FT.DKReason,
+        FT.Symbol,
+        FT.SymbolSfx,
+        FT.SecurityID,
+        FT.IDSource,
+        FT.SecurityType,
+        FT.MaturityMonthYear,
+        FT.MaturityDay,
+        FT.PutOrCall,
+        FT.StrikePrice,
+        FT.OptAttribute,
+        FT.ContractMultiplier,
+        FT.CouponRate,
+        FT.SecurityExchange,
+        FT.Issuer,
+        FT.EncodedIssuerLen,
+        FT.EncodedIssuer,
+        FT.SecurityDesc,
+        FT.EncodedSecurityDescLen,
+        FT.EncodedSecurityDesc,
+        FT.Side,
+        FT.OrderQty,
+        FT.CashOrderQty,
+        FT.LastShares,
+        FT.LastPx,
+        FT.Text,
+        FT.EncodedTextLen,
+        FT.EncodedText,
+    )
+}
 
 
 class DontKnowTrade(FixMessage):
 
+    __slots__ = ()
+
     _msg_type = "Q"
+    _msg_type_bytes = b"Q"
 
-    _fields = OrderedDict({
+    _fields = {
         FT.OrderID: True,
         FT.ExecID: True,
         FT.DKReason: True,
@@ -44,7 +83,12 @@ class DontKnowTrade(FixMessage):
         FT.Text: False,
         FT.EncodedTextLen: False,
         FT.EncodedText: False,
-    })
+    }
+
+    _get_spec = {
+        tag: (is_required, validators[TYPE_MAP[tag]])
+        for tag, is_required in _fields.items()
+    }
 
     def __init__(
         self,
@@ -55,491 +99,44 @@ class DontKnowTrade(FixMessage):
         side: str,
     ) -> None:
         super().__init__()
-        self.append_pair(35, self._msg_type)
-        self.append_pair(
-            FT.OrderID,
-            convert("STRING", order_id),
-        )
-        self.append_pair(
-            FT.ExecID,
-            convert("STRING", exec_id),
-        )
-        self.append_pair(
-            FT.DKReason,
-            convert("CHAR", dk_reason),
-        )
-        self.append_pair(
-            FT.Symbol,
-            convert("STRING", symbol),
-        )
-        self.append_pair(
-            FT.Side,
-            convert("CHAR", side),
-        )
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.OrderID]) -> str:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.ExecID]) -> str:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.DKReason]) -> str:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.Symbol]) -> str:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.Side]) -> str:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.SymbolSfx]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.SecurityID]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.IDSource]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.SecurityType]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.MaturityMonthYear]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.MaturityDay]) -> t.Optional[int]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.PutOrCall]) -> t.Optional[int]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.StrikePrice]) -> t.Optional[Decimal]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.OptAttribute]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.ContractMultiplier]) -> t.Optional[float]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.CouponRate]) -> t.Optional[float]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.SecurityExchange]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.Issuer]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.EncodedIssuerLen]) -> t.Optional[int]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.EncodedIssuer]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.SecurityDesc]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.EncodedSecurityDescLen]) -> t.Optional[int]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.EncodedSecurityDesc]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.OrderQty]) -> t.Optional[Decimal]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.CashOrderQty]) -> t.Optional[Decimal]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.LastShares]) -> t.Optional[Decimal]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.LastPx]) -> t.Optional[Decimal]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.Text]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.EncodedTextLen]) -> t.Optional[int]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.EncodedText]) -> t.Optional[str]:
-        ...
-
-    def get(self, tag: FT):  # NOQA
-        is_required = self._fields[tag]
+        self.append_msg_type(self._msg_type_bytes)
+        self.extend_pairs((
+            (
+                b"37",
+                _convert_string(order_id).encode(),
+            ),
+            (
+                b"17",
+                _convert_string(exec_id).encode(),
+            ),
+            (
+                b"127",
+                _convert_char(dk_reason).encode(),
+            ),
+            (
+                b"55",
+                _convert_string(symbol).encode(),
+            ),
+            (
+                b"54",
+                _convert_char(side).encode(),
+            ),
+        ))
+
+    def get(self, tag: FT):
+        is_required, validator = self._get_spec[tag]
         val = self.get_raw(tag)
         if val is None:
             if is_required:
                 raise ValueError
             return None
-        return validate(TYPE_MAP[tag], val)
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.OrderID],
-        val: str,
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.ExecID],
-        val: str,
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.DKReason],
-        val: str,
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.Symbol],
-        val: str,
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.SymbolSfx],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.SecurityID],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.IDSource],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.SecurityType],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.MaturityMonthYear],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.MaturityDay],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.PutOrCall],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.StrikePrice],
-        val: t.Optional[Decimal],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.OptAttribute],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.ContractMultiplier],
-        val: t.Optional[float],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.CouponRate],
-        val: t.Optional[float],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.SecurityExchange],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.Issuer],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.EncodedIssuerLen],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.EncodedIssuer],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.SecurityDesc],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.EncodedSecurityDescLen],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.EncodedSecurityDesc],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.Side],
-        val: str,
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.OrderQty],
-        val: t.Optional[Decimal],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.CashOrderQty],
-        val: t.Optional[Decimal],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.LastShares],
-        val: t.Optional[Decimal],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.LastPx],
-        val: t.Optional[Decimal],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.Text],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.EncodedTextLen],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.EncodedText],
-        val: t.Optional[str],
-    ) -> None:
-        ...
+        return validator(val)
 
-    def append(self, tag: FT, val: t.Any):  # NOQA
-        if tag is FT.OrderID:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.ExecID:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.DKReason:
-            assert isinstance(val, str)
-            converted = convert("CHAR", val)
-        elif tag is FT.Symbol:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.SymbolSfx:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.SecurityID:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.IDSource:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.SecurityType:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.MaturityMonthYear:
-            assert isinstance(val, str)
-            converted = convert("MONTHYEAR", val)
-        elif tag is FT.MaturityDay:
-            assert isinstance(val, int)
-            converted = convert("DAYOFMONTH", val)
-        elif tag is FT.PutOrCall:
-            assert isinstance(val, int)
-            converted = convert("INT", val)
-        elif tag is FT.StrikePrice:
-            assert isinstance(val, Decimal)
-            converted = convert("PRICE", val)
-        elif tag is FT.OptAttribute:
-            assert isinstance(val, str)
-            converted = convert("CHAR", val)
-        elif tag is FT.ContractMultiplier:
-            assert isinstance(val, float)
-            converted = convert("FLOAT", val)
-        elif tag is FT.CouponRate:
-            assert isinstance(val, float)
-            converted = convert("FLOAT", val)
-        elif tag is FT.SecurityExchange:
-            assert isinstance(val, str)
-            converted = convert("EXCHANGE", val)
-        elif tag is FT.Issuer:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.EncodedIssuerLen:
-            assert isinstance(val, int)
-            converted = convert("LENGTH", val)
-        elif tag is FT.EncodedIssuer:
-            assert isinstance(val, str)
-            converted = convert("DATA", val)
-        elif tag is FT.SecurityDesc:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.EncodedSecurityDescLen:
-            assert isinstance(val, int)
-            converted = convert("LENGTH", val)
-        elif tag is FT.EncodedSecurityDesc:
-            assert isinstance(val, str)
-            converted = convert("DATA", val)
-        elif tag is FT.Side:
-            assert isinstance(val, str)
-            converted = convert("CHAR", val)
-        elif tag is FT.OrderQty:
-            assert isinstance(val, Decimal)
-            converted = convert("QTY", val)
-        elif tag is FT.CashOrderQty:
-            assert isinstance(val, Decimal)
-            converted = convert("QTY", val)
-        elif tag is FT.LastShares:
-            assert isinstance(val, Decimal)
-            converted = convert("QTY", val)
-        elif tag is FT.LastPx:
-            assert isinstance(val, Decimal)
-            converted = convert("PRICE", val)
-        elif tag is FT.Text:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.EncodedTextLen:
-            assert isinstance(val, int)
-            converted = convert("LENGTH", val)
-        elif tag is FT.EncodedText:
-            assert isinstance(val, str)
-            converted = convert("DATA", val)
-        else:
+    def append(self, tag: FT, val: t.Any):
+        appender = _APPENDERS.get(tag)
+        if appender is None:
             raise ValueError(f"{tag} is not a valid FIX tag")
-        self.append_pair(tag, converted)
+        appender(self, val)
 
     @classmethod
     def cast(cls, msg: FixMessage) -> "DontKnowTrade":
@@ -1,19 +1,66 @@
 import typing as t
-import typing_extensions as te
-from collections import OrderedDict
-import datetime as dt
-from decimal import Decimal
 
 from fixtrate.message import FixMessage
 from .types import FixTag as FT, TYPE_MAP
-from .validate import validate, convert, cast as _cast
+from .validate import validators, converters, get_appender, cast as _cast
+
+
+_convert_string = converters["STRING"]
+_convert_char = converters["CHAR"]
+_convert_int = converters["INT"]
+
+_APPENDERS = {
+    tag: get_appender(tag)
+    for tag in (
+        FT.EmailThreadID,
+        FT.EmailType,
+        FT.OrigTime,
+        FT.Subject,
+        FT.EncodedSubjectLen,
+        FT.EncodedSubject,
+        FT.NoRoutingIDs,
+        FT.RoutingType,
+        FT.RoutingID,
+        FT.NoRelatedSym,
+        FT.RelatdSym,
+        FT.SymbolSfx,
+        FT.SecurityID,
+        FT.IDSource,
+        FT.SecurityType,
+        FT.MaturityMonthYear,
+        FT.MaturityDay,
+        FT.PutOrCall,
+        FT.StrikePrice,
+        FT.OptAttribute,
+        FT.ContractMultiplier,
+        FT.CouponRate,
+        FT.SecurityExchange,
+        FT.Issuer,
+        FT.EncodedIssuerLen,
+        FT.EncodedIssuer,
+        FT.SecurityDesc,
+        FT.EncodedSecurityDescLen,
+        FT.EncodedSecurityDesc,
+        FT.OrderID,
+        FT.ClOrdID,
+        FT.LinesOfText,
+        FT.Text,
+        FT.EncodedTextLen,
+        FT.EncodedText,
+        FT.RawDataLength,
+        FT.RawData,
+    )
+}
 
 
 class Email(FixMessage):
 
+    __slots__ = ()
+
     _msg_type = "C"
+    _msg_type_bytes = b"C"
 
-    _fields = OrderedDict({
+    _fields = {
         FT.EmailThreadID: True,
         FT.EmailType: True,
         FT.OrigTime: False,
@@ -51,7 +98,12 @@ class Email(FixMessage):
         FT.EncodedText: False,
         FT.RawDataLength: False,
         FT.RawData: False,
-    })
+    }
+
+    _get_spec = {
+        tag: (is_required, validators[TYPE_MAP[tag]])
+        for tag, is_required in _fields.items()
+    }
 
     def __init__(
         self,
@@ -62,596 +114,44 @@ class Email(FixMessage):
         text: str,
     ) -> None:
         super().__init__()
-        self.append_pair(35, self._msg_type)
-        self.append_pair(
-            FT.EmailThreadID,
-            convert("STRING", email_thread_id),
-        )
-        self.append_pair(
-            FT.EmailType,
-            convert("CHAR", email_type),
-        )
-        self.append_pair(
-            FT.Subject,
-            convert("STRING", subject),
-        )
-        self.append_pair(
-            FT.LinesOfText,
-            convert("INT", lines_of_text),
-        )
-        self.append_pair(
-            FT.Text,
-            convert("STRING", text),
-        )
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.EmailThreadID]) -> str:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.EmailType]) -> str:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.Subject]) -> str:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.LinesOfText]) -> int:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.Text]) -> str:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.OrigTime]) -> t.Optional[dt.datetime]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.EncodedSubjectLen]) -> t.Optional[int]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.EncodedSubject]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.NoRoutingIDs]) -> t.Optional[int]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.RoutingType]) -> t.Optional[int]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.RoutingID]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.NoRelatedSym]) -> t.Optional[int]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.RelatdSym]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.SymbolSfx]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.SecurityID]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.IDSource]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.SecurityType]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.MaturityMonthYear]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.MaturityDay]) -> t.Optional[int]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.PutOrCall]) -> t.Optional[int]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.StrikePrice]) -> t.Optional[Decimal]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.OptAttribute]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.ContractMultiplier]) -> t.Optional[float]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.CouponRate]) -> t.Optional[float]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.SecurityExchange]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.Issuer]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.EncodedIssuerLen]) -> t.Optional[int]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.EncodedIssuer]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.SecurityDesc]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.EncodedSecurityDescLen]) -> t.Optional[int]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.EncodedSecurityDesc]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.OrderID]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.ClOrdID]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.EncodedTextLen]) -> t.Optional[int]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.EncodedText]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.RawDataLength]) -> t.Optional[int]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.RawData]) -> t.Optional[str]:
-        ...
-
-    def get(self, tag: FT):  # NOQA
-        is_required = self._fields[tag]
+        self.append_msg_type(self._msg_type_bytes)
+        self.extend_pairs((
+            (
+                b"164",
+                _convert_string(email_thread_id).encode(),
+            ),
+            (
+                b"94",
+                _convert_char(email_type).encode(),
+            ),
+            (
+                b"147",
+                _convert_string(subject).encode(),
+            ),
+            (
+                b"33",
+                _convert_int(lines_of_text).encode(),
+            ),
+            (
+                b"58",
+                _convert_string(text).encode(),
+            ),
+        ))
+
+    def get(self, tag: FT):
+        is_required, validator = self._get_spec[tag]
         val = self.get_raw(tag)
         if val is None:
             if is_required:
                 raise ValueError
             return None
-        return validate(TYPE_MAP[tag], val)
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.EmailThreadID],
-        val: str,
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.EmailType],
-        val: str,
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.OrigTime],
-        val: t.Optional[dt.datetime],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.Subject],
-        val: str,
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.EncodedSubjectLen],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.EncodedSubject],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.NoRoutingIDs],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.RoutingType],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.RoutingID],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.NoRelatedSym],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.RelatdSym],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.SymbolSfx],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.SecurityID],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.IDSource],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.SecurityType],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.MaturityMonthYear],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.MaturityDay],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.PutOrCall],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.StrikePrice],
-        val: t.Optional[Decimal],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.OptAttribute],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.ContractMultiplier],
-        val: t.Optional[float],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.CouponRate],
-        val: t.Optional[float],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.SecurityExchange],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.Issuer],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.EncodedIssuerLen],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.EncodedIssuer],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.SecurityDesc],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.EncodedSecurityDescLen],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.EncodedSecurityDesc],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.OrderID],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.ClOrdID],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.LinesOfText],
-        val: int,
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.Text],
-        val: str,
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.EncodedTextLen],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.EncodedText],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.RawDataLength],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.RawData],
-        val: t.Optional[str],
-    ) -> None:
-        ...
+        return validator(val)
 
-    def append(self, tag: FT, val: t.Any):  # NOQA
-        if tag is FT.EmailThreadID:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.EmailType:
-            assert isinstance(val, str)
-            converted = convert("CHAR", val)
-        elif tag is FT.OrigTime:
-            assert isinstance(val, dt.datetime)
-            converted = convert("UTCTIMESTAMP", val)
-        elif tag is FT.Subject:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.EncodedSubjectLen:
-            assert isinstance(val, int)
-            converted = convert("LENGTH", val)
-        elif tag is FT.EncodedSubject:
-            assert isinstance(val, str)
-            converted = convert("DATA", val)
-        elif tag is FT.NoRoutingIDs:
-            assert isinstance(val, int)
-            converted = convert("INT", val)
-        elif tag is FT.RoutingType:
-            assert isinstance(val, int)
-            converted = convert("INT", val)
-        elif tag is FT.RoutingID:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.NoRelatedSym:
-            assert isinstance(val, int)
-            converted = convert("INT", val)
-        elif tag is FT.RelatdSym:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.SymbolSfx:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.SecurityID:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.IDSource:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.SecurityType:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.MaturityMonthYear:
-            assert isinstance(val, str)
-            converted = convert("MONTHYEAR", val)
-        elif tag is FT.MaturityDay:
-            assert isinstance(val, int)
-            converted = convert("DAYOFMONTH", val)
-        elif tag is FT.PutOrCall:
-            assert isinstance(val, int)
-            converted = convert("INT", val)
-        elif tag is FT.StrikePrice:
-            assert isinstance(val, Decimal)
-            converted = convert("PRICE", val)
-        elif tag is FT.OptAttribute:
-            assert isinstance(val, str)
-            converted = convert("CHAR", val)
-        elif tag is FT.ContractMultiplier:
-            assert isinstance(val, float)
-            converted = convert("FLOAT", val)
-        elif tag is FT.CouponRate:
-            assert isinstance(val, float)
-            converted = convert("FLOAT", val)
-        elif tag is FT.SecurityExchange:
-            assert isinstance(val, str)
-            converted = convert("EXCHANGE", val)
-        elif tag is FT.Issuer:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.EncodedIssuerLen:
-            assert isinstance(val, int)
-            converted = convert("LENGTH", val)
-        elif tag is FT.EncodedIssuer:
-            assert isinstance(val, str)
-            converted = convert("DATA", val)
-        elif tag is FT.SecurityDesc:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.EncodedSecurityDescLen:
-            assert isinstance(val, int)
-            converted = convert("LENGTH", val)
-        elif tag is FT.EncodedSecurityDesc:
-            assert isinstance(val, str)
-            converted = convert("DATA", val)
-        elif tag is FT.OrderID:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.ClOrdID:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.LinesOfText:
-            assert isinstance(val, int)
-            converted = convert("INT", val)
-        elif tag is FT.Text:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.EncodedTextLen:
-            assert isinstance(val, int)
-            converted = convert("LENGTH", val)
-        elif tag is FT.EncodedText:
-            assert isinstance(val, str)
-            converted = convert("DATA", val)
-        elif tag is FT.RawDataLength:
-            assert isinstance(val, int)
-            converted = convert("LENGTH", val)
-        elif tag is FT.RawData:
-            assert isinstance(val, str)
-            converted = convert("DATA", val)
-        else:
+    def append(self, tag: FT, val: t.Any):
+        appender = _APPENDERS.get(tag)
+        if appender is None:
             raise ValueError(f"{tag} is not a valid FIX tag")
-        self.append_pair(tag, converted)
+        appender(self, val)
 
     @classmethod
     def cast(cls, msg: FixMessage) -> "Email":
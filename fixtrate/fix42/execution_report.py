@@ -1,19 +1,127 @@
 import typing as t
-import typing_extensions as te
-from collections import OrderedDict
-import datetime as dt
 from decimal import Decimal
 
 from fixtrate.message import FixMessage
 from .types import FixTag as FT, TYPE_MAP
-from .validate import validate, convert, cast as _cast
+from .validate import validators, converters, get_appender, cast as _cast
+
+
+_convert_string = converters["STRING"]
+_convert_char = converters["CHAR"]
+_convert_qty = converters["QTY"]
+_convert_price = converters["PRICE"]
+
+_APPENDERS = {
+    tag: get_appender(tag)
+    for tag in (
+        FT.OrderID,
+        FT.SecondaryOrderID,
+        FT.ClOrdID,
+        FT.OrigClOrdID,
+        FT.ClientID,
+        FT.ExecBroker,
+        FT.NoContraBrokers,
+        FT.ContraBroker,
+        FT.ContraTrader,
+        FT.ContraTradeQty,
+        FT.ContraTradeTime,
+        FT.ListID,
+        FT.ExecID,
+        FT.ExecTransType,
+        FT.ExecRefID,
+        FT.ExecType,
+        FT.OrdStatus,
+        FT.OrdRejReason,
+        FT.ExecRestatementReason,
+        FT.Account,
+        FT.SettlmntTyp,
+        FT.FutSettDate,
+        FT.Symbol,
+        FT.SymbolSfx,
+        FT.SecurityID,
+        FT.IDSource,
+        FT.SecurityType,
+        FT.MaturityMonthYear,
+        FT.MaturityDay,
+        FT.PutOrCall,
+        FT.StrikePrice,
+        FT.OptAttribute,
+        FT.ContractMultiplier,
+        FT.CouponRate,
+        FT.SecurityExchange,
+        FT.Issuer,
+        FT.EncodedIssuerLen,
+        FT.EncodedIssuer,
+        FT.SecurityDesc,
+        FT.EncodedSecurityDescLen,
+        FT.EncodedSecurityDesc,
+        FT.Side,
+        FT.OrderQty,
+        FT.CashOrderQty,
+        FT.OrdType,
+        FT.Price,
+        FT.StopPx,
+        FT.PegDifference,
+        FT.DiscretionInst,
+        FT.DiscretionOffset,
+        FT.Currency,
+        FT.ComplianceID,
+        FT.SolicitedFlag,
+        FT.TimeInForce,
+        FT.EffectiveTime,
+        FT.ExpireDate,
+        FT.ExpireTime,
+        FT.ExecInst,
+        FT.Rule80A,
+        FT.LastShares,
+        FT.LastPx,
+        FT.LastSpotRate,
+        FT.LastForwardPoints,
+        FT.LastMkt,
+        FT.TradingSessionID,
+        FT.LastCapacity,
+        FT.LeavesQty,
+        FT.CumQty,
+        FT.AvgPx,
+        FT.DayOrderQty,
+        FT.DayCumQty,
+        FT.DayAvgPx,
+        FT.GTBookingInst,
+        FT.TradeDate,
+        FT.TransactTime,
+        FT.ReportToExch,
+        FT.Commission,
+        FT.CommType,
+        FT.GrossTradeAmt,
+        FT.SettlCurrAmt,
+        FT.SettlCurrency,
+        FT.SettlCurrFxRate,
+        FT.SettlCurrFxRateCalc,
+        FT.HandlInst,
+        FT.MinQty,
+        FT.MaxFloor,
+        FT.OpenClose,
+        FT.MaxShow,
+        FT.Text,
+        FT.EncodedTextLen,
+        FT.EncodedText,
+        FT.FutSettDate2,
+        FT.OrderQty2,
+        FT.ClearingFirm,
+        FT.ClearingAccount,
+        FT.MultiLegReportingType,
+    )
+}
 
 
 class ExecutionReport(FixMessage):
 
+    __slots__ = ()
+
     _msg_type = "8"
+    _msg_type_bytes = b"8"
 
-    _fields = OrderedDict({
+    _fields = {
         FT.OrderID: True,
         FT.SecondaryOrderID: False,
         FT.ClOrdID: False,
@@ -110,7 +218,12 @@ class ExecutionReport(FixMessage):
         FT.ClearingFirm: False,
         FT.ClearingAccount: False,
         FT.MultiLegReportingType: False,
-    })
+    }
+
+    _get_spec = {
+        tag: (is_required, validators[TYPE_MAP[tag]])
+        for tag, is_required in _fields.items()
+    }
 
     def __init__(
         self,
@@ -126,1501 +239,64 @@ class ExecutionReport(FixMessage):
         avg_px: Decimal,
     ) -> None:
         super().__init__()
-        self.append_pair(35, self._msg_type)
-        self.append_pair(
-            FT.OrderID,
-            convert("STRING", order_id),
-        )
-        self.append_pair(
-            FT.ExecID,
-            convert("STRING", exec_id),
-        )
-        self.append_pair(
-            FT.ExecTransType,
-            convert("CHAR", exec_trans_type),
-        )
-        self.append_pair(
-            FT.ExecType,
-            convert("CHAR", exec_type),
-        )
-        self.append_pair(
-            FT.OrdStatus,
-            convert("CHAR", ord_status),
-        )
-        self.append_pair(
-            FT.Symbol,
-            convert("STRING", symbol),
-        )
-        self.append_pair(
-            FT.Side,
-            convert("CHAR", side),
-        )
-        self.append_pair(
-            FT.LeavesQty,
-            convert("QTY", leaves_qty),
-        )
-        self.append_pair(
-            FT.CumQty,
-            convert("QTY", cum_qty),
-        )
-        self.append_pair(
-            FT.AvgPx,
-            convert("PRICE", avg_px),
-        )
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.OrderID]) -> str:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.ExecID]) -> str:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.ExecTransType]) -> str:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.ExecType]) -> str:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.OrdStatus]) -> str:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.Symbol]) -> str:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.Side]) -> str:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.LeavesQty]) -> Decimal:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.CumQty]) -> Decimal:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.AvgPx]) -> Decimal:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.SecondaryOrderID]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.ClOrdID]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.OrigClOrdID]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.ClientID]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.ExecBroker]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.NoContraBrokers]) -> t.Optional[int]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.ContraBroker]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.ContraTrader]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.ContraTradeQty]) -> t.Optional[Decimal]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.ContraTradeTime]) -> t.Optional[dt.datetime]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.ListID]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.ExecRefID]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.OrdRejReason]) -> t.Optional[int]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.ExecRestatementReason]) -> t.Optional[int]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.Account]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.SettlmntTyp]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.FutSettDate]) -> t.Optional[dt.date]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.SymbolSfx]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.SecurityID]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.IDSource]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.SecurityType]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.MaturityMonthYear]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.MaturityDay]) -> t.Optional[int]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.PutOrCall]) -> t.Optional[int]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.StrikePrice]) -> t.Optional[Decimal]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.OptAttribute]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.ContractMultiplier]) -> t.Optional[float]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.CouponRate]) -> t.Optional[float]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.SecurityExchange]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.Issuer]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.EncodedIssuerLen]) -> t.Optional[int]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.EncodedIssuer]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.SecurityDesc]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.EncodedSecurityDescLen]) -> t.Optional[int]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.EncodedSecurityDesc]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.OrderQty]) -> t.Optional[Decimal]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.CashOrderQty]) -> t.Optional[Decimal]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.OrdType]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.Price]) -> t.Optional[Decimal]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.StopPx]) -> t.Optional[Decimal]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.PegDifference]) -> t.Optional[Decimal]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.DiscretionInst]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.DiscretionOffset]) -> t.Optional[Decimal]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.Currency]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.ComplianceID]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.SolicitedFlag]) -> t.Optional[bool]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.TimeInForce]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.EffectiveTime]) -> t.Optional[dt.datetime]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.ExpireDate]) -> t.Optional[dt.date]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.ExpireTime]) -> t.Optional[dt.datetime]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.ExecInst]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.Rule80A]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.LastShares]) -> t.Optional[Decimal]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.LastPx]) -> t.Optional[Decimal]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.LastSpotRate]) -> t.Optional[Decimal]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.LastForwardPoints]) -> t.Optional[Decimal]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.LastMkt]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.TradingSessionID]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.LastCapacity]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.DayOrderQty]) -> t.Optional[Decimal]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.DayCumQty]) -> t.Optional[Decimal]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.DayAvgPx]) -> t.Optional[Decimal]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.GTBookingInst]) -> t.Optional[int]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.TradeDate]) -> t.Optional[dt.date]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.TransactTime]) -> t.Optional[dt.datetime]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.ReportToExch]) -> t.Optional[bool]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.Commission]) -> t.Optional[Decimal]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.CommType]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.GrossTradeAmt]) -> t.Optional[Decimal]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.SettlCurrAmt]) -> t.Optional[Decimal]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.SettlCurrency]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.SettlCurrFxRate]) -> t.Optional[float]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.SettlCurrFxRateCalc]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.HandlInst]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.MinQty]) -> t.Optional[Decimal]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.MaxFloor]) -> t.Optional[Decimal]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.OpenClose]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.MaxShow]) -> t.Optional[Decimal]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.Text]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.EncodedTextLen]) -> t.Optional[int]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.EncodedText]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.FutSettDate2]) -> t.Optional[dt.date]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.OrderQty2]) -> t.Optional[Decimal]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.ClearingFirm]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.ClearingAccount]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.MultiLegReportingType]) -> t.Optional[str]:
-        ...
-
-    def get(self, tag: FT):  # NOQA
-        is_required = self._fields[tag]
+        self.append_msg_type(self._msg_type_bytes)
+        self.extend_pairs((
+            (
+                b"37",
+                _convert_string(order_id).encode(),
+            ),
+            (
+                b"17",
+                _convert_string(exec_id).encode(),
+            ),
+            (
+                b"20",
+                _convert_char(exec_trans_type).encode(),
+            ),
+            (
+                b"150",
+                _convert_char(exec_type).encode(),
+            ),
+            (
+                b"39",
+                _convert_char(ord_status).encode(),
+            ),
+            (
+                b"55",
+                _convert_string(symbol).encode(),
+            ),
+            (
+                b"54",
+                _convert_char(side).encode(),
+            ),
+            (
+                b"151",
+                _convert_qty(leaves_qty).encode(),
+            ),
+            (
+                b"14",
+                _convert_qty(cum_qty).encode(),
+            ),
+            (
+                b"6",
+                _convert_price(avg_px).encode(),
+            ),
+        ))
+
+    def get(self, tag: FT):
+        is_required, validator = self._get_spec[tag]
         val = self.get_raw(tag)
         if val is None:
             if is_required:
                 raise ValueError
             return None
-        return validate(TYPE_MAP[tag], val)
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.OrderID],
-        val: str,
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.SecondaryOrderID],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.ClOrdID],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.OrigClOrdID],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.ClientID],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.ExecBroker],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.NoContraBrokers],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.ContraBroker],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.ContraTrader],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.ContraTradeQty],
-        val: t.Optional[Decimal],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.ContraTradeTime],
-        val: t.Optional[dt.datetime],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.ListID],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.ExecID],
-        val: str,
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.ExecTransType],
-        val: str,
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.ExecRefID],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.ExecType],
-        val: str,
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.OrdStatus],
-        val: str,
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.OrdRejReason],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.ExecRestatementReason],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.Account],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.SettlmntTyp],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.FutSettDate],
-        val: t.Optional[dt.date],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.Symbol],
-        val: str,
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.SymbolSfx],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.SecurityID],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.IDSource],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.SecurityType],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.MaturityMonthYear],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.MaturityDay],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.PutOrCall],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.StrikePrice],
-        val: t.Optional[Decimal],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.OptAttribute],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.ContractMultiplier],
-        val: t.Optional[float],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.CouponRate],
-        val: t.Optional[float],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.SecurityExchange],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.Issuer],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.EncodedIssuerLen],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.EncodedIssuer],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.SecurityDesc],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.EncodedSecurityDescLen],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.EncodedSecurityDesc],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.Side],
-        val: str,
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.OrderQty],
-        val: t.Optional[Decimal],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.CashOrderQty],
-        val: t.Optional[Decimal],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.OrdType],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.Price],
-        val: t.Optional[Decimal],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.StopPx],
-        val: t.Optional[Decimal],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.PegDifference],
-        val: t.Optional[Decimal],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.DiscretionInst],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.DiscretionOffset],
-        val: t.Optional[Decimal],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.Currency],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.ComplianceID],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.SolicitedFlag],
-        val: t.Optional[bool],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.TimeInForce],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.EffectiveTime],
-        val: t.Optional[dt.datetime],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.ExpireDate],
-        val: t.Optional[dt.date],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.ExpireTime],
-        val: t.Optional[dt.datetime],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.ExecInst],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.Rule80A],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.LastShares],
-        val: t.Optional[Decimal],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.LastPx],
-        val: t.Optional[Decimal],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.LastSpotRate],
-        val: t.Optional[Decimal],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.LastForwardPoints],
-        val: t.Optional[Decimal],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.LastMkt],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.TradingSessionID],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.LastCapacity],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.LeavesQty],
-        val: Decimal,
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.CumQty],
-        val: Decimal,
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.AvgPx],
-        val: Decimal,
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.DayOrderQty],
-        val: t.Optional[Decimal],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.DayCumQty],
-        val: t.Optional[Decimal],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.DayAvgPx],
-        val: t.Optional[Decimal],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.GTBookingInst],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.TradeDate],
-        val: t.Optional[dt.date],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.TransactTime],
-        val: t.Optional[dt.datetime],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.ReportToExch],
-        val: t.Optional[bool],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.Commission],
-        val: t.Optional[Decimal],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.CommType],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.GrossTradeAmt],
-        val: t.Optional[Decimal],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.SettlCurrAmt],
-        val: t.Optional[Decimal],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.SettlCurrency],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.SettlCurrFxRate],
-        val: t.Optional[float],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.SettlCurrFxRateCalc],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.HandlInst],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.MinQty],
-        val: t.Optional[Decimal],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.MaxFloor],
-        val: t.Optional[Decimal],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.OpenClose],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.MaxShow],
-        val: t.Optional[Decimal],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.Text],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.EncodedTextLen],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.EncodedText],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.FutSettDate2],
-        val: t.Optional[dt.date],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.OrderQty2],
-        val: t.Optional[Decimal],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.ClearingFirm],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.ClearingAccount],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.MultiLegReportingType],
-        val: t.Optional[str],
-    ) -> None:
-        ...
+        return validator(val)
 
-    def append(self, tag: FT, val: t.Any):  # NOQA
-        if tag is FT.OrderID:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.SecondaryOrderID:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.ClOrdID:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.OrigClOrdID:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.ClientID:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.ExecBroker:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.NoContraBrokers:
-            assert isinstance(val, int)
-            converted = convert("INT", val)
-        elif tag is FT.ContraBroker:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.ContraTrader:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.ContraTradeQty:
-            assert isinstance(val, Decimal)
-            converted = convert("QTY", val)
-        elif tag is FT.ContraTradeTime:
-            assert isinstance(val, dt.datetime)
-            converted = convert("UTCTIMESTAMP", val)
-        elif tag is FT.ListID:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.ExecID:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.ExecTransType:
-            assert isinstance(val, str)
-            converted = convert("CHAR", val)
-        elif tag is FT.ExecRefID:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.ExecType:
-            assert isinstance(val, str)
-            converted = convert("CHAR", val)
-        elif tag is FT.OrdStatus:
-            assert isinstance(val, str)
-            converted = convert("CHAR", val)
-        elif tag is FT.OrdRejReason:
-            assert isinstance(val, int)
-            converted = convert("INT", val)
-        elif tag is FT.ExecRestatementReason:
-            assert isinstance(val, int)
-            converted = convert("INT", val)
-        elif tag is FT.Account:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.SettlmntTyp:
-            assert isinstance(val, str)
-            converted = convert("CHAR", val)
-        elif tag is FT.FutSettDate:
-            assert isinstance(val, dt.date)
-            converted = convert("LOCALMKTDATE", val)
-        elif tag is FT.Symbol:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.SymbolSfx:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.SecurityID:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.IDSource:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.SecurityType:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.MaturityMonthYear:
-            assert isinstance(val, str)
-            converted = convert("MONTHYEAR", val)
-        elif tag is FT.MaturityDay:
-            assert isinstance(val, int)
-            converted = convert("DAYOFMONTH", val)
-        elif tag is FT.PutOrCall:
-            assert isinstance(val, int)
-            converted = convert("INT", val)
-        elif tag is FT.StrikePrice:
-            assert isinstance(val, Decimal)
-            converted = convert("PRICE", val)
-        elif tag is FT.OptAttribute:
-            assert isinstance(val, str)
-            converted = convert("CHAR", val)
-        elif tag is FT.ContractMultiplier:
-            assert isinstance(val, float)
-            converted = convert("FLOAT", val)
-        elif tag is FT.CouponRate:
-            assert isinstance(val, float)
-            converted = convert("FLOAT", val)
-        elif tag is FT.SecurityExchange:
-            assert isinstance(val, str)
-            converted = convert("EXCHANGE", val)
-        elif tag is FT.Issuer:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.EncodedIssuerLen:
-            assert isinstance(val, int)
-            converted = convert("LENGTH", val)
-        elif tag is FT.EncodedIssuer:
-            assert isinstance(val, str)
-            converted = convert("DATA", val)
-        elif tag is FT.SecurityDesc:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.EncodedSecurityDescLen:
-            assert isinstance(val, int)
-            converted = convert("LENGTH", val)
-        elif tag is FT.EncodedSecurityDesc:
-            assert isinstance(val, str)
-            converted = convert("DATA", val)
-        elif tag is FT.Side:
-            assert isinstance(val, str)
-            converted = convert("CHAR", val)
-        elif tag is FT.OrderQty:
-            assert isinstance(val, Decimal)
-            converted = convert("QTY", val)
-        elif tag is FT.CashOrderQty:
-            assert isinstance(val, Decimal)
-            converted = convert("QTY", val)
-        elif tag is FT.OrdType:
-            assert isinstance(val, str)
-            converted = convert("CHAR", val)
-        elif tag is FT.Price:
-            assert isinstance(val, Decimal)
-            converted = convert("PRICE", val)
-        elif tag is FT.StopPx:
-            assert isinstance(val, Decimal)
-            converted = convert("PRICE", val)
-        elif tag is FT.PegDifference:
-            assert isinstance(val, Decimal)
-            converted = convert("PRICEOFFSET", val)
-        elif tag is FT.DiscretionInst:
-            assert isinstance(val, str)
-            converted = convert("CHAR", val)
-        elif tag is FT.DiscretionOffset:
-            assert isinstance(val, Decimal)
-            converted = convert("PRICEOFFSET", val)
-        elif tag is FT.Currency:
-            assert isinstance(val, str)
-            converted = convert("CURRENCY", val)
-        elif tag is FT.ComplianceID:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.SolicitedFlag:
-            assert isinstance(val, bool)
-            converted = convert("BOOLEAN", val)
-        elif tag is FT.TimeInForce:
-            assert isinstance(val, str)
-            converted = convert("CHAR", val)
-        elif tag is FT.EffectiveTime:
-            assert isinstance(val, dt.datetime)
-            converted = convert("UTCTIMESTAMP", val)
-        elif tag is FT.ExpireDate:
-            assert isinstance(val, dt.date)
-            converted = convert("LOCALMKTDATE", val)
-        elif tag is FT.ExpireTime:
-            assert isinstance(val, dt.datetime)
-            converted = convert("UTCTIMESTAMP", val)
-        elif tag is FT.ExecInst:
-            assert isinstance(val, str)
-            converted = convert("MULTIPLEVALUESTRING", val)
-        elif tag is FT.Rule80A:
-            assert isinstance(val, str)
-            converted = convert("CHAR", val)
-        elif tag is FT.LastShares:
-            assert isinstance(val, Decimal)
-            converted = convert("QTY", val)
-        elif tag is FT.LastPx:
-            assert isinstance(val, Decimal)
-            converted = convert("PRICE", val)
-        elif tag is FT.LastSpotRate:
-            assert isinstance(val, Decimal)
-            converted = convert("PRICE", val)
-        elif tag is FT.LastForwardPoints:
-            assert isinstance(val, Decimal)
-            converted = convert("PRICEOFFSET", val)
-        elif tag is FT.LastMkt:
-            assert isinstance(val, str)
-            converted = convert("EXCHANGE", val)
-        elif tag is FT.TradingSessionID:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.LastCapacity:
-            assert isinstance(val, str)
-            converted = convert("CHAR", val)
-        elif tag is FT.LeavesQty:
-            assert isinstance(val, Decimal)
-            converted = convert("QTY", val)
-        elif tag is FT.CumQty:
-            assert isinstance(val, Decimal)
-            converted = convert("QTY", val)
-        elif tag is FT.AvgPx:
-            assert isinstance(val, Decimal)
-            converted = convert("PRICE", val)
-        elif tag is FT.DayOrderQty:
-            assert isinstance(val, Decimal)
-            converted = convert("QTY", val)
-        elif tag is FT.DayCumQty:
-            assert isinstance(val, Decimal)
-            converted = convert("QTY", val)
-        elif tag is FT.DayAvgPx:
-            assert isinstance(val, Decimal)
-            converted = convert("PRICE", val)
-        elif tag is FT.GTBookingInst:
-            assert isinstance(val, int)
-            converted = convert("INT", val)
-        elif tag is FT.TradeDate:
-            assert isinstance(val, dt.date)
-            converted = convert("LOCALMKTDATE", val)
-        elif tag is FT.TransactTime:
-            assert isinstance(val, dt.datetime)
-            converted = convert("UTCTIMESTAMP", val)
-        elif tag is FT.ReportToExch:
-            assert isinstance(val, bool)
-            converted = convert("BOOLEAN", val)
-        elif tag is FT.Commission:
-            assert isinstance(val, Decimal)
-            converted = convert("AMT", val)
-        elif tag is FT.CommType:
-            assert isinstance(val, str)
-            converted = convert("CHAR", val)
-        elif tag is FT.GrossTradeAmt:
-            assert isinstance(val, Decimal)
-            converted = convert("AMT", val)
-        elif tag is FT.SettlCurrAmt:
-            assert isinstance(val, Decimal)
-            converted = convert("AMT", val)
-        elif tag is FT.SettlCurrency:
-            assert isinstance(val, str)
-            converted = convert("CURRENCY", val)
-        elif tag is FT.SettlCurrFxRate:
-            assert isinstance(val, float)
-            converted = convert("FLOAT", val)
-        elif tag is FT.SettlCurrFxRateCalc:
-            assert isinstance(val, str)
-            converted = convert("CHAR", val)
-        elif tag is FT.HandlInst:
-            assert isinstance(val, str)
-            converted = convert("CHAR", val)
-        elif tag is FT.MinQty:
-            assert isinstance(val, Decimal)
-            converted = convert("QTY", val)
-        elif tag is FT.MaxFloor:
-            assert isinstance(val, Decimal)
-            converted = convert("QTY", val)
-        elif tag is FT.OpenClose:
-            assert isinstance(val, str)
-            converted = convert("CHAR", val)
-        elif tag is FT.MaxShow:
-            assert isinstance(val, Decimal)
-            converted = convert("QTY", val)
-        elif tag is FT.Text:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.EncodedTextLen:
-            assert isinstance(val, int)
-            converted = convert("LENGTH", val)
-        elif tag is FT.EncodedText:
-            assert isinstance(val, str)
-            converted = convert("DATA", val)
-        elif tag is FT.FutSettDate2:
-            assert isinstance(val, dt.date)
-            converted = convert("LOCALMKTDATE", val)
-        elif tag is FT.OrderQty2:
-            assert isinstance(val, Decimal)
-            converted = convert("QTY", val)
-        elif tag is FT.ClearingFirm:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.ClearingAccount:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.MultiLegReportingType:
-            assert isinstance(val, str)
-            converted = convert("CHAR", val)
-        else:
+    def append(self, tag: FT, val: t.Any):
+        appender = _APPENDERS.get(tag)
+        if appender is None:
             raise ValueError(f"{tag} is not a valid FIX tag")
-        self.append_pair(tag, converted)
+        appender(self, val)
 
     @classmethod
     def cast(cls, msg: FixMessage) -> "ExecutionReport":
@@ -0,0 +1,270 @@
+import typing as t
+import typing_extensions as te
+import datetime as dt
+from decimal import Decimal
+
+from fixtrate.message import FixMessage
+from .types import FixTag as FT
+
+
+class ListStatus(FixMessage):
+    _msg_type: str
+    _msg_type_bytes: bytes
+
+    def __init__(
+        self,
+        list_id: str,
+        list_status_type: int,
+        no_rpts: int,
+        list_order_status: int,
+        rpt_seq: int,
+        tot_no_orders: int,
+        no_orders: int,
+        cl_ord_id: str,
+        cum_qty: Decimal,
+        ord_status: str,
+        leaves_qty: Decimal,
+        cxl_qty: Decimal,
+        avg_px: Decimal,
+    ) -> None:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.ListID]) -> str:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.ListStatusType]) -> int:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.NoRpts]) -> int:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.ListOrderStatus]) -> int:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.RptSeq]) -> int:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.TotNoOrders]) -> int:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.NoOrders]) -> int:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.ClOrdID]) -> str:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.CumQty]) -> Decimal:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.OrdStatus]) -> str:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.LeavesQty]) -> Decimal:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.CxlQty]) -> Decimal:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.AvgPx]) -> Decimal:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.ListStatusText]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.EncodedListStatusTextLen]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.EncodedListStatusText]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.TransactTime]) -> t.Optional[dt.datetime]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.OrdRejReason]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.Text]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.EncodedTextLen]) -> t.Optional[int]:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.EncodedText]) -> t.Optional[str]:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.ListID],
+        val: str,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.ListStatusType],
+        val: int,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.NoRpts],
+        val: int,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.ListOrderStatus],
+        val: int,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.RptSeq],
+        val: int,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.ListStatusText],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.EncodedListStatusText],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.TransactTime],
+        val: t.Optional[dt.datetime],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.TotNoOrders],
+        val: int,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.NoOrders],
+        val: int,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.ClOrdID],
+        val: str,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.CumQty],
+        val: Decimal,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.OrdStatus],
+        val: str,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.LeavesQty],
+        val: Decimal,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.CxlQty],
+        val: Decimal,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.AvgPx],
+        val: Decimal,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.OrdRejReason],
+        val: t.Optional[int],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.Text],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.EncodedText],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @classmethod
+    def cast(cls, msg: FixMessage) -> "ListStatus":
+        ...
@@ -0,0 +1,44 @@
+import typing as t
+import typing_extensions as te
+
+from fixtrate.message import FixMessage
+from .types import FixTag as FT
+
+
+class SequenceReset(FixMessage):
+    _msg_type: str
+    _msg_type_bytes: bytes
+
+    def __init__(
+        self,
+        new_seq_no: int,
+    ) -> None:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.NewSeqNo]) -> int:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.GapFillFlag]) -> t.Optional[bool]:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.GapFillFlag],
+        val: t.Optional[bool],
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.NewSeqNo],
+        val: int,
+    ) -> None:
+        ...
+
+    @classmethod
+    def cast(cls, msg: FixMessage) -> "SequenceReset":
+        ...
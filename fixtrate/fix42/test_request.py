@@ -1,54 +1,63 @@
 import typing as t
-import typing_extensions as te
-from collections import OrderedDict
-import datetime as dt
-from decimal import Decimal
 
 from fixtrate.message import FixMessage
 from .types import FixTag as FT, TYPE_MAP
-from .validate import validate, convert, cast as _cast
+from .validate import validators, converters, get_appender, cast as _cast
+
+
+_convert_string = converters["STRING"]
+
+_APPENDERS = {
+    tag: get_appender(tag)
+    for tag in (
+        FT.TestReqID,
+    )
+}
 
 
 class TestRequest(FixMessage):
 
+    __slots__ = ()
+
     _msg_type = "1"
+    _msg_type_bytes = b"1"
 
-    _fields = OrderedDict({
+    _fields = {
         FT.TestReqID: True,
-    })
+    }
+
+    _get_spec = {
+        tag: (is_required, validators[TYPE_MAP[tag]])
+        for tag, is_required in _fields.items()
+    }
 
     def __init__(
         self,
         test_req_id: str,
     ) -> None:
         super().__init__()
-        self.append_pair(35, self._msg_type)
-        self.append_pair(
-            FT.TestReqID,
-            convert("STRING", test_req_id),
-        )
+        self.append_msg_type(self._msg_type_bytes)
+        self.extend_pairs((
+            (
+                b"112",
+                _convert_string(test_req_id).encode(),
+            ),
+        ))
 
-    def get(self, tag: te.Literal[FT.TestReqID]) -> str:
+    def get(self, tag: FT):
+        is_required, validator = self._get_spec[tag]
         val = self.get_raw(tag)
         if val is None:
-            raise ValueError
-        return validate(TYPE_MAP[tag], val)
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.TestReqID],
-        val: str,
-    ) -> None:
-        ...
+            if is_required:
+                raise ValueError
+            return None
+        return validator(val)
 
-    def append(self, tag: FT, val: t.Any):  # NOQA
-        if tag is FT.TestReqID:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        else:
+    def append(self, tag: FT, val: t.Any):
+        appender = _APPENDERS.get(tag)
+        if appender is None:
             raise ValueError(f"{tag} is not a valid FIX tag")
-        self.append_pair(tag, converted)
+        appender(self, val)
 
     @classmethod
     def cast(cls, msg: FixMessage) -> "TestRequest":
@@ -1,25 +1,44 @@
 import typing as t
-import typing_extensions as te
-from collections import OrderedDict
-import datetime as dt
-from decimal import Decimal
 
 from fixtrate.message import FixMessage
 from .types import FixTag as FT, TYPE_MAP
-from .validate import validate, convert, cast as _cast
+from .validate import validators, converters, get_appender, cast as _cast
+
+
+_convert_string = converters["STRING"]
+_convert_char = converters["CHAR"]
+
+_APPENDERS = {
+    tag: get_appender(tag)
+    for tag in (
+        FT.TradSesReqID,
+        FT.TradingSessionID,
+        FT.TradSesMethod,
+        FT.TradSesMode,
+        FT.SubscriptionRequestType,
+    )
+}
 
 
 class TradingSessionStatusRequest(FixMessage):
 
+    __slots__ = ()
+
     _msg_type = "g"
+    _msg_type_bytes = b"g"
 
-    _fields = OrderedDict({
+    _fields = {
         FT.TradSesReqID: True,
         FT.TradingSessionID: False,
         FT.TradSesMethod: False,
         FT.TradSesMode: False,
         FT.SubscriptionRequestType: True,
-    })
+    }
+
+    _get_spec = {
+        tag: (is_required, validators[TYPE_MAP[tag]])
+        for tag, is_required in _fields.items()
+    }
 
     def __init__(
         self,
@@ -27,104 +46,32 @@ class TradingSessionStatusRequest(FixMessage):
         subscription_request_type: str,
     ) -> None:
         super().__init__()
-        self.append_pair(35, self._msg_type)
-        self.append_pair(
-            FT.TradSesReqID,
-            convert("STRING", trad_ses_req_id),
-        )
-        self.append_pair(
-            FT.SubscriptionRequestType,
-            convert("CHAR", subscription_request_type),
-        )
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.TradSesReqID]) -> str:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.SubscriptionRequestType]) -> str:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.TradingSessionID]) -> t.Optional[str]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.TradSesMethod]) -> t.Optional[int]:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.TradSesMode]) -> t.Optional[int]:
-        ...
-
-    def get(self, tag: FT):  # NOQA
-        is_required = self._fields[tag]
+        self.append_msg_type(self._msg_type_bytes)
+        self.extend_pairs((
+            (
+                b"335",
+                _convert_string(trad_ses_req_id).encode(),
+            ),
+            (
+                b"263",
+                _convert_char(subscription_request_type).encode(),
+            ),
+        ))
+
+    def get(self, tag: FT):
+        is_required, validator = self._get_spec[tag]
         val = self.get_raw(tag)
         if val is None:
             if is_required:
                 raise ValueError
             return None
-        return validate(TYPE_MAP[tag], val)
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.TradSesReqID],
-        val: str,
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.TradingSessionID],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.TradSesMethod],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.TradSesMode],
-        val: t.Optional[int],
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.SubscriptionRequestType],
-        val: str,
-    ) -> None:
-        ...
+        return validator(val)
 
-    def append(self, tag: FT, val: t.Any):  # NOQA
-        if tag is FT.TradSesReqID:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.TradingSessionID:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        elif tag is FT.TradSesMethod:
-            assert isinstance(val, int)
-            converted = convert("INT", val)
-        elif tag is FT.TradSesMode:
-            assert isinstance(val, int)
-            converted = convert("INT", val)
-        elif tag is FT.SubscriptionRequestType:
-            assert isinstance(val, str)
-            converted = convert("CHAR", val)
-        else:
+    def append(self, tag: FT, val: t.Any):
+        appender = _APPENDERS.get(tag)
+        if appender is None:
             raise ValueError(f"{tag} is not a valid FIX tag")
-        self.append_pair(tag, converted)
+        appender(self, val)
 
     @classmethod
     def cast(cls, msg: FixMessage) -> "TradingSessionStatusRequest":
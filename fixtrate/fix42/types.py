@@ -819,4 +819,28 @@ TYPE_MAP: t.Dict[str, str] = {
     FT.ListStatusText: "STRING",
     FT.EncodedListStatusTextLen: "LENGTH",
     FT.EncodedListStatusText: "DATA",
+}
+
+
+TAG_BYTES: t.Dict[str, bytes] = {
+    tag: tag.value.encode() for tag in FT
+}
+
+
+# LENGTH field carrying the byte length of each DATA field.
+DATA_LENGTH: t.Dict[str, str] = {
+    FT.Signature: FT.SignatureLength,
+    FT.SecureData: FT.SecureDataLen,
+    FT.RawData: FT.RawDataLength,
+    FT.XmlData: FT.XmlDataLen,
+    FT.EncodedIssuer: FT.EncodedIssuerLen,
+    FT.EncodedSecurityDesc: FT.EncodedSecurityDescLen,
+    FT.EncodedListExecInst: FT.EncodedListExecInstLen,
+    FT.EncodedText: FT.EncodedTextLen,
+    FT.EncodedSubject: FT.EncodedSubjectLen,
+    FT.EncodedHeadline: FT.EncodedHeadlineLen,
+    FT.EncodedAllocText: FT.EncodedAllocTextLen,
+    FT.EncodedUnderlyingIssuer: FT.EncodedUnderlyingIssuerLen,
+    FT.EncodedUnderlyingSecurityDesc: FT.EncodedUnderlyingSecurityDescLen,
+    FT.EncodedListStatusText: FT.EncodedListStatusTextLen,
 }
\ No newline at end of file
@@ -2,7 +2,7 @@ import datetime as dt
 from decimal import Decimal
 import typing as t
 from fixtrate.message import FixMessage
-from .types import TYPE_MAP
+from .types import TYPE_MAP, TAG_BYTES, DATA_LENGTH
 
 
 MONTHS = {
@@ -14,7 +14,38 @@ MONTHS = {
 VF = t.TypeVar("VF", bound=t.Callable[[str], t.Any])
 CF = t.TypeVar("CF", bound=t.Callable[[t.Any], str])
 validators: t.Dict[str, t.Callable[[str], t.Any]] = {}
-converters: t.Dict[str, t.Callable[[str], t.Any]] = {}
+converters: t.Dict[str, t.Callable[[t.Any], str]] = {}
+
+# Python type ``append`` expects for each FIX data type. Mirrors
+# ``fixtrate.cli.gen_types.TYPE_MAP``.
+PY_TYPES: t.Dict[str, type] = {
+    "BOOLEAN": bool,
+    "INT": int,
+    "LENGTH": int,
+    "DAYOFMONTH": int,
+    "NUMINGROUP": int,
+    "SEQNUM": int,
+    "FLOAT": float,
+    "AMT": Decimal,
+    "QTY": Decimal,
+    "PRICE": Decimal,
+    "PRICEOFFSET": Decimal,
+    "DATA": str,
+    "CHAR": str,
+    "STRING": str,
+    "CURRENCY": str,
+    "EXCHANGE": str,
+    "MONTHYEAR": str,
+    "MULTIPLEVALUESTRING": str,
+    "LOCALMKTDATE": dt.date,
+    "UTCDATE": dt.date,
+    "UTCTIMEONLY": dt.time,
+    "UTCTIMESTAMP": dt.datetime,
+}
+
+# Type-check values passed to the generated ``append`` methods. Off
+# under ``python -O``; set to True to keep the checks regardless.
+VALIDATE_APPEND = __debug__
 
 
 def validator(*types: str) -> t.Callable[[VF], VF]:
@@ -33,12 +64,6 @@ def converter(*types: str) -> t.Callable[[CF], CF]:
     return decorator
 
 
-@validator("STRING", "CHAR", "EXCHANGE", "CURRENCY")
-@converter("STRING", "CHAR", "EXCHANGE", "CURRENCY")
-def validate_str(val: str) -> str:
-    return val
-
-
 @validator("BOOLEAN")
 def validate_bool(val: str) -> bool:
     if val == "Y":
@@ -56,14 +81,28 @@ def convert_bool(val: bool) -> str:
         return "N"
 
 
-@validator("INT")
-def validate_int(val: str) -> int:
-    return int(val)
+# The string and plain numeric types map straight onto builtins, so
+# register those instead of wrapping them; ``get`` and ``append`` then
+# call into C without an extra Python frame per field. ``str`` returns
+# str arguments unchanged, so it also serves as the identity conversion.
+validator("STRING", "CHAR", "EXCHANGE", "CURRENCY", "DATA")(str)
+validator("INT")(int)
+validator("FLOAT")(float)
+validator("AMT", "QTY", "PRICE", "PRICEOFFSET")(Decimal)
+converter(
+    "STRING", "CHAR", "EXCHANGE", "CURRENCY", "DATA", "INT", "FLOAT"
+)(str)
 
 
-@converter("INT")
-def convert_int(val: int) -> str:
-    return str(val)
+@converter("AMT", "QTY", "PRICE", "PRICEOFFSET")
+def convert_decimal(val: Decimal) -> str:
+    # ``str`` is by far the fastest way to format a Decimal, but it
+    # switches to exponent notation (e.g. ``1E+2``) which FIX does not
+    # allow, so only fall back to fixed-point formatting in that case.
+    as_str = str(val)
+    if "E" in as_str:
+        return format(val, "f")
+    return as_str
 
 
 @validator("LENGTH")
@@ -87,36 +126,6 @@ def convert_length(val: int) -> str:
     return str(val)
 
 
-@validator("FLOAT")
-def validate_float(val: str) -> float:
-    return float(val)
-
-
-@converter("FLOAT")
-def convert_float(val: float) -> str:
-    return str(val)
-
-
-@validator(
-    "AMT",
-    "QTY",
-    "PRICE",
-    "PRICEOFFSET"
-)
-def validate_decimal(val: str) -> Decimal:
-    return Decimal(val)
-
-
-@converter(
-    "AMT",
-    "QTY",
-    "PRICE",
-    "PRICEOFFSET"
-)
-def convert_decimal(val: Decimal) -> str:
-    return str(val)
-
-
 @validator("LOCALMKTDATE", "UTCDATE")
 def validate_date(val: str) -> dt.date:
     format = "%Y%m%d"
@@ -125,8 +134,7 @@ def validate_date(val: str) -> dt.date:
 
 @converter("LOCALMKTDATE", "UTCDATE")
 def convert_date(val: dt.date) -> str:
-    format = "%Y%m%d"
-    return val.strftime(format)
+    return "%04d%02d%02d" % (val.year, val.month, val.day)
 
 
 @validator("UTCTIMEONLY")
@@ -151,8 +159,15 @@ def validate_datetime(val: str) -> dt.datetime:
 
 @converter("UTCTIMESTAMP")
 def convert_datetime(val: dt.datetime) -> str:
-    format = "%Y%m%d-%H:%M:%S.%f"
-    return val.strftime(format)
+    return "%04d%02d%02d-%02d:%02d:%02d.%06d" % (
+        val.year,
+        val.month,
+        val.day,
+        val.hour,
+        val.minute,
+        val.second,
+        val.microsecond,
+    )
 
 
 @validator("MONTHYEAR")
@@ -165,7 +180,11 @@ def validate_month(val: str) -> str:
 @validator("DAYOFMONTH")
 def validate_dom(val: str) -> int:
     asint = int(val)
-    assert asint in range(1, 31 + 1)
+    if asint not in range(1, 31 + 1):
+        raise ValueError(
+            "Value of type 'DAYOFMONTH' must be "
+            "a positive integer between 1 and 31"
+        )
     return asint
 
 
@@ -208,10 +227,94 @@ def convert(type: str, val: t.Any) -> str:
     return converter(val)
 
 
+def make_appender(
+    tag: str,
+    py_type: type,
+    converter: t.Callable[[t.Any], str],
+) -> t.Callable[[FixMessage, t.Any], None]:
+    tag_bytes = TAG_BYTES[tag]
+
+    def append(msg: FixMessage, val: t.Any) -> None:
+        # Like simplefix, appending None leaves the field unset.
+        if val is None:
+            return
+        if VALIDATE_APPEND and not isinstance(val, py_type):
+            raise TypeError(
+                f"Value of {tag} must be of type {py_type.__name__}")
+        msg.append_raw(tag_bytes, converter(val).encode())
+
+    return append
+
+
+def make_data_appender(
+    tag: str,
+    length_tag: str,
+) -> t.Callable[[FixMessage, t.Any], None]:
+    tag_bytes = TAG_BYTES[tag]
+    length_bytes = TAG_BYTES[length_tag]
+
+    def append_data(msg: FixMessage, val: t.Any) -> None:
+        if val is None:
+            return
+        if VALIDATE_APPEND and not isinstance(val, str):
+            raise TypeError(f"Value of {tag} must be of type str")
+        encoded = val.encode()
+        msg.extend_pairs((
+            (length_bytes, str(len(encoded)).encode()),
+            (tag_bytes, encoded),
+        ))
+
+    return append_data
+
+
+def make_length_appender(
+    tag: str,
+    data_tag: str,
+) -> t.Callable[[FixMessage, t.Any], None]:
+    def append_length(msg: FixMessage, val: t.Any) -> None:
+        raise ValueError(
+            f"{tag} is set when appending {data_tag}, "
+            "it cannot be appended on its own"
+        )
+
+    return append_length
+
+
+_DATA_FOR_LENGTH = {length: data for data, length in DATA_LENGTH.items()}
+
+_appenders: t.Dict[str, t.Callable[[FixMessage, t.Any], None]] = {}
+
+
+def get_appender(tag: str) -> t.Callable[[FixMessage, t.Any], None]:
+    """
+    Return the appender for ``tag``, creating it on first use. Message
+    classes sharing a tag share its appender.
+
+    Appending a DATA field also appends its LENGTH field, e.g.
+    EncodedTextLen<354> for EncodedText<355>, so those LENGTH fields
+    cannot be appended explicitly.
+    """
+    appender = _appenders.get(tag)
+    if appender is not None:
+        return appender
+    if tag in DATA_LENGTH:
+        appender = make_data_appender(tag, DATA_LENGTH[tag])
+    elif tag in _DATA_FOR_LENGTH:
+        appender = make_length_appender(tag, _DATA_FOR_LENGTH[tag])
+    else:
+        fix_type = TYPE_MAP[tag]
+        appender = make_appender(
+            tag, PY_TYPES[fix_type], converters[fix_type])
+    _appenders[tag] = appender
+    return appender
+
+
 def cast(
     cls: t.Type[T],
     base: FixMessage
 ) -> T:
+    if type(base) is cls:
+        return base
     for field, required in cls._fields.items():
         val = base.get_raw(field)
         if val is None:
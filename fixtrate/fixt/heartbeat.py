@@ -1,43 +1,48 @@
 import typing as t
-import typing_extensions as te
-from collections import OrderedDict
-import datetime as dt
-from decimal import Decimal
 
 from fixtrate.message import FixMessage
 from .types import FixTag as FT, TYPE_MAP
-from .validate import validate, convert, cast as _cast
+from .validate import validators, get_appender, cast as _cast
+
+
+_APPENDERS = {
+    tag: get_appender(tag)
+    for tag in (
+        FT.TestReqID,
+    )
+}
 
 
 class Heartbeat(FixMessage):
 
+    __slots__ = ()
+
     _msg_type = "0"
+    _msg_type_bytes = b"0"
 
-    _fields = OrderedDict({
+    _fields = {
         FT.TestReqID: False,
-    })
+    }
 
-    def get(self, tag: te.Literal[FT.TestReqID]) -> t.Optional[str]:
+    _get_spec = {
+        tag: (is_required, validators[TYPE_MAP[tag]])
+        for tag, is_required in _fields.items()
+    }
+
+    def get(self, tag: FT):
+        is_required, validator = self._get_spec[tag]
         val = self.get_raw(tag)
         if val is None:
+            if is_required:
+                raise ValueError
             return None
-        return validate(TYPE_MAP[tag], val)
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.TestReqID],
-        val: t.Optional[str],
-    ) -> None:
-        ...
-
-    def append(self, tag: FT, val: t.Any):  # NOQA
-        if tag is FT.TestReqID:
-            assert isinstance(val, str)
-            converted = convert("STRING", val)
-        else:
+        return validator(val)
+
+    def append(self, tag: FT, val: t.Any):
+        appender = _APPENDERS.get(tag)
+        if appender is None:
             raise ValueError(f"{tag} is not a valid FIX tag")
-        self.append_pair(tag, converted)
+        appender(self, val)
 
     @classmethod
     def cast(cls, msg: FixMessage) -> "Heartbeat":
@@ -0,0 +1,24 @@
+import typing as t
+import typing_extensions as te
+
+from fixtrate.message import FixMessage
+from .types import FixTag as FT
+
+
+class Heartbeat(FixMessage):
+    _msg_type: str
+    _msg_type_bytes: bytes
+
+    def get(self, tag: te.Literal[FT.TestReqID]) -> t.Optional[str]:
+        ...
+
+    def append(
+        self,
+        tag: te.Literal[FT.TestReqID],
+        val: t.Optional[str],
+    ) -> None:
+        ...
+
+    @classmethod
+    def cast(cls, msg: FixMessage) -> "Heartbeat":
+        ...
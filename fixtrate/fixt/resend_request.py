@@ -1,22 +1,37 @@
 import typing as t
-import typing_extensions as te
-from collections import OrderedDict
-import datetime as dt
-from decimal import Decimal
 
 from fixtrate.message import FixMessage
 from .types import FixTag as FT, TYPE_MAP
-from .validate import validate, convert, cast as _cast
+from .validate import validators, converters, get_appender, cast as _cast
+
+
+_convert_seqnum = converters["SEQNUM"]
+
+_APPENDERS = {
+    tag: get_appender(tag)
+    for tag in (
+        FT.BeginSeqNo,
+        FT.EndSeqNo,
+    )
+}
 
 
 class ResendRequest(FixMessage):
 
+    __slots__ = ()
+
     _msg_type = "2"
+    _msg_type_bytes = b"2"
 
-    _fields = OrderedDict({
+    _fields = {
         FT.BeginSeqNo: True,
         FT.EndSeqNo: True,
-    })
+    }
+
+    _get_spec = {
+        tag: (is_required, validators[TYPE_MAP[tag]])
+        for tag, is_required in _fields.items()
+    }
 
     def __init__(
         self,
@@ -24,59 +39,32 @@ class ResendRequest(FixMessage):
         end_seq_no: int,
     ) -> None:
         super().__init__()
-        self.append_pair(35, self._msg_type)
-        self.append_pair(
-            FT.BeginSeqNo,
-            convert("SEQNUM", begin_seq_no),
-        )
-        self.append_pair(
-            FT.EndSeqNo,
-            convert("SEQNUM", end_seq_no),
-        )
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.BeginSeqNo]) -> int:
-        ...
-
-    @t.overload  # NOQA
-    def get(self, tag: te.Literal[FT.EndSeqNo]) -> int:
-        ...
+        self.append_msg_type(self._msg_type_bytes)
+        self.extend_pairs((
+            (
+                b"7",
+                _convert_seqnum(begin_seq_no).encode(),
+            ),
+            (
+                b"16",
+                _convert_seqnum(end_seq_no).encode(),
+            ),
+        ))
 
-    def get(self, tag: FT):  # NOQA
-        is_required = self._fields[tag]
+    def get(self, tag: FT):
+        is_required, validator = self._get_spec[tag]
         val = self.get_raw(tag)
         if val is None:
             if is_required:
                 raise ValueError
             return None
-        return validate(TYPE_MAP[tag], val)
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.BeginSeqNo],
-        val: int,
-    ) -> None:
-        ...
-
-    @t.overload  # NOQA
-    def append(
-        self,
-        tag: te.Literal[FT.EndSeqNo],
-        val: int,
-    ) -> None:
-        ...
+        return validator(val)
 
-    def append(self, tag: FT, val: t.Any):  # NOQA
-        if tag is FT.BeginSeqNo:
-            assert isinstance(val, int)
-            converted = convert("SEQNUM", val)
-        elif tag is FT.EndSeqNo:
-            assert isinstance(val, int)
-            converted = convert("SEQNUM", val)
-        else:
+    def append(self, tag: FT, val: t.Any):
+        appender = _APPENDERS.get(tag)
+        if appender is None:
             raise ValueError(f"{tag} is not a valid FIX tag")
-        self.append_pair(tag, converted)
+        appender(self, val)
 
     @classmethod
     def cast(cls, msg: FixMessage) -> "ResendRequest":
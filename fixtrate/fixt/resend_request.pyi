@@ -0,0 +1,45 @@
+import typing as t
+import typing_extensions as te
+
+from fixtrate.message import FixMessage
+from .types import FixTag as FT
+
+
+class ResendRequest(FixMessage):
+    _msg_type: str
+    _msg_type_bytes: bytes
+
+    def __init__(
+        self,
+        begin_seq_no: int,
+        end_seq_no: int,
+    ) -> None:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.BeginSeqNo]) -> int:
+        ...
+
+    @t.overload
+    def get(self, tag: te.Literal[FT.EndSeqNo]) -> int:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.BeginSeqNo],
+        val: int,
+    ) -> None:
+        ...
+
+    @t.overload
+    def append(
+        self,
+        tag: te.Literal[FT.EndSeqNo],
+        val: int,
+    ) -> None:
+        ...
+
+    @classmethod
+    def cast(cls, msg: FixMessage) -> "ResendRequest":
+        ...
@@ -0,0 +1,29 @@
+import typing_extensions as te
+
+from fixtrate.message import FixMessage
+from .types import FixTag as FT
+
+
+class TestRequest(FixMessage):
+    _msg_type: str
+    _msg_type_bytes: bytes
+
+    def __init__(
+        self,
+        test_req_id: str,
+    ) -> None:
+        ...
+
+    def get(self, tag: te.Literal[FT.TestReqID]) -> str:
+        ...
+
+    def append(
+        self,
+        tag: te.Literal[FT.TestReqID],
+        val: str,
+    ) -> None:
+        ...
+
+    @classmethod
+    def cast(cls, msg: FixMessage) -> "TestRequest":
+        ...
@@ -134,3 +134,18 @@ TYPE_MAP: t.Dict[str, str] = {
     FT.RefCstmApplVerID: "STRING",
     FT.DefaultApplVerID: "STRING",
 }
+
+
+TAG_BYTES: t.Dict[str, bytes] = {
+    tag: tag.value.encode() for tag in FT
+}
+
+
+# LENGTH field carrying the byte length of each DATA field.
+DATA_LENGTH: t.Dict[str, str] = {
+    FT.Signature: FT.SignatureLength,
+    FT.SecureData: FT.SecureDataLen,
+    FT.RawData: FT.RawDataLength,
+    FT.XmlData: FT.XmlDataLen,
+    FT.EncodedText: FT.EncodedTextLen,
+}
@@ -2,14 +2,20 @@ import datetime as dt
 import typing as t
 
 import simplefix as sf
+from simplefix.message import fix_val
 from .fixt import data as VALUES
-from .fixt.types import FixTag as TAGS
+from .fixt.types import FixTag as TAGS, TAG_BYTES
 
 
 __all__ = ("FixMessage", )
 
 MT = VALUES.MsgType
 
+SOH = b"\x01"
+
+# Fields placed by ``encode`` itself rather than taken from the body.
+ENCODED_TAGS = frozenset((b"8", b"9", b"35", b"10"))
+
 ADMIN_MESSAGES = {
     MT.LOGON,
     MT.LOGOUT,
@@ -25,6 +31,8 @@ if t.TYPE_CHECKING:
 
 
 class FixMessage:
+    __slots__ = ("_msg", )
+
     _fields: t.Dict[str, bool] = {}
     _msg: sf.FixMessage
 
@@ -49,7 +57,50 @@ class FixMessage:
         value: t.Any,
         header: bool = False,
     ) -> None:
-        self._msg.append_pair(tag, value, header)
+        # Tags known to fixt are encoded once in TAG_BYTES. FixTag
+        # members of either version hash like their string values, so
+        # fix42 members of those tags hit the table as well.
+        tag_bytes = TAG_BYTES.get(tag)  # type: ignore
+        if (
+            tag_bytes is None
+            or header
+            or value is None
+            or tag_bytes in ENCODED_TAGS
+        ):
+            self._msg.append_pair(tag, value, header)
+            return
+        self._msg.pairs.append((tag_bytes, fix_val(value)))
+
+    def append_msg_type(self, msg_type: bytes) -> None:
+        """
+        Set MsgType<35> from its already encoded value. Equivalent to
+        ``append_pair(35, msg_type)`` without the tag and value
+        conversion.
+        """
+        msg = self._msg
+        msg.message_type = msg_type
+        msg.pairs.append((b"35", msg_type))
+
+    def append_raw(self, tag: bytes, value: bytes) -> None:
+        """
+        Append an already encoded ``(tag, value)`` pair to the
+        message body, skipping the tag and value conversion done
+        by :meth:`append_pair`.
+
+        Must not be used for BeginString<8> or MsgType<35>.
+        """
+        self._msg.pairs.append((tag, value))
+
+    def extend_pairs(
+        self,
+        pairs: t.Iterable[t.Tuple[bytes, bytes]],
+    ) -> None:
+        """
+        Append several already encoded ``(tag, value)`` pairs to the
+        message body in one call. The same restrictions as
+        :meth:`append_raw` apply.
+        """
+        self._msg.pairs.extend(pairs)
 
     def append_utc_timestamp(
         self,
@@ -80,7 +131,7 @@ class FixMessage:
         """
         Read-only property. Returns the FIX version for this message..
 
-        :return: :class:`~fix.contants.FixVersion` or `None`
+        :return: :class:`~fixtrate.constants.FixVersion` or `None`
         :raises: `ValueError` if version string is not a valid FIX version or
             if BeginString<8> is not set on message..
         """
@@ -145,7 +196,31 @@ class FixMessage:
         self._msg.remove(tag)
 
     def encode(self) -> bytes:
-        return self._msg.encode()
+        """
+        Encode the message to its on-the-wire form, setting
+        BodyLength<9> and CheckSum<10>.
+
+        Equivalent to :meth:`simplefix.FixMessage.encode`, but the
+        body is joined in a single pass and the checksum is summed in
+        C rather than byte by byte.
+
+        :raises: `ValueError` if MsgType<35> or BeginString<8> is not
+            set on this message.
+        """
+        msg = self._msg
+        if msg.message_type is None:
+            raise ValueError("No message type set")
+        if not msg.begin_string:
+            raise ValueError("No begin string set")
+        fields = [b"35=" + msg.message_type]
+        fields.extend(
+            tag + b"=" + value
+            for tag, value in msg.pairs
+            if tag not in ENCODED_TAGS
+        )
+        body = SOH.join(fields) + SOH
+        buf = b"8=%s\x019=%d\x01%s" % (msg.begin_string, len(body), body)
+        return buf + b"10=%03d\x01" % (sum(buf) % 256)
 
     def to_decoded_pairs(self) -> t.List[t.Tuple[int, t.Any]]:
         """
@@ -132,7 +132,7 @@ class FixSession:
         """ Return all messages sent and received in the
         current session.
 
-        :rtype AsyncIterator[:class:`~fix.message.FixMessage`]
+        :rtype AsyncIterator[:class:`~fixtrate.message.FixMessage`]
         """
         return self._store.get_msgs(*args, **kwargs)
 
@@ -189,7 +189,7 @@ class FixSession:
         Send a FIX message to peer.
 
         :param msg: message to send.
-        :type msg: :class:`~fix.message.FixMessage`
+        :type msg: :class:`~fixtrate.message.FixMessage`
         """
         if self.closed:
             raise exc.SessionClosedError
@@ -17,7 +17,7 @@ class FixStore:
         """ Increment the local sequence number by 1.
 
         :param session: The current session.
-        :type session: :class:`~fix.session.FixSession`
+        :type session: :class:`~fixtrate.session.FixSession`
 
         """
         raise NotImplementedError
@@ -26,7 +26,7 @@ class FixStore:
         """ Increment the remote sequence number by 1.
 
         :param session: The current session.
-        :type session: :class:`~fix.session.FixSession`
+        :type session: :class:`~fixtrate.session.FixSession`
 
         """
         raise NotImplementedError
@@ -35,7 +35,7 @@ class FixStore:
         """ Get the local sequence number.
 
         :param session: The current session.
-        :type session: :class:`~fix.session.FixSession`
+        :type session: :class:`~fixtrate.session.FixSession`
 
         """
         raise NotImplementedError
@@ -44,7 +44,7 @@ class FixStore:
         """ Get the remote sequence number.
 
         :param session: The current session.
-        :type session: :class:`~fix.session.FixSession`
+        :type session: :class:`~fixtrate.session.FixSession`
 
         """
         raise NotImplementedError
@@ -53,7 +53,7 @@ class FixStore:
         """ Set the local sequence number to a new number.
 
         :param session: The current session.
-        :type session: :class:`~fix.session.FixSession`
+        :type session: :class:`~fixtrate.session.FixSession`
 
         :param new_seq_num: The new sequence number.
         :type new_seq_num: int
@@ -65,7 +65,7 @@ class FixStore:
         """ Set the remote sequence number to a new number.
 
         :param session: The current session.
-        :type session: :class:`~fix.session.FixSession`
+        :type session: :class:`~fixtrate.session.FixSession`
 
         :param new_seq_num: The new sequence number.
         :type new_seq_num: int
@@ -77,10 +77,10 @@ class FixStore:
         """ Store a message in the store.
 
         :param session: The current session.
-        :type session: :class:`~fix.session.FixSession`
+        :type session: :class:`~fixtrate.session.FixSession`
 
         :param msg: The message to store.
-        :type msg: :class:`~fix.message.FixMessage`
+        :type msg: :class:`~fixtrate.message.FixMessage`
 
         :rtype str
         """
@@ -115,7 +115,7 @@ class FixStore:
             by sequence number.
 
             :param session: The current session.
-            :type session: :class:`~fix.session.FixSession`
+            :type session: :class:`~fixtrate.session.FixSession`
 
             :param start: Beginning datetime. If specified, only returns
                 messages sent or received on or after specified time.
@@ -0,0 +1,210 @@
+import pytest  # type: ignore
+import datetime as dt
+from decimal import Decimal
+
+from fixtrate.fix42.allocation_ack_batch import build_many
+from fixtrate.fix42.bid_response_batch import build_bid_response
+from fixtrate.fix42 import validate
+from fixtrate.fix42.types import FixTag
+from fixtrate.message import FixMessage
+from fixtrate.fix42.allocation_instruction_ack import (
+    AllocationInstructionAck
+)
+from fixtrate.fix42.bid_response import BidResponse
+from fixtrate.fix42.execution_report import ExecutionReport
+
+
+def test_allocation_ack_build_many():
+    alloc_ids = ["A1", "A2", "A3"]
+    trade_dates = [dt.date(2020, 1, 2)] * 2 + [dt.date(2020, 1, 3)]
+    statuses = [0, 1, 2]
+
+    msgs = build_many(alloc_ids, trade_dates, statuses)
+
+    expected = [
+        AllocationInstructionAck(*args)
+        for args in zip(alloc_ids, trade_dates, statuses)
+    ]
+    assert [str(m) for m in msgs] == [str(m) for m in expected]
+    assert msgs[1].get_raw(75) == "20200102"
+
+
+def test_build_bid_response():
+    msg = build_bid_response(
+        [Decimal("1.5"), Decimal("2")], ["1", "2"],
+        prices=[Decimal("10"), Decimal("11.25")],
+    )
+
+    expected = BidResponse(2, Decimal("1.5"), "1")
+    expected.append(FixTag.Price, Decimal("10"))
+    expected.append(FixTag.Commission, Decimal("2"))
+    expected.append(FixTag.CommType, "2")
+    expected.append(FixTag.Price, Decimal("11.25"))
+    assert str(msg) == str(expected)
+
+    with pytest.raises(ValueError):
+        build_bid_response([Decimal("1")], ["1"], sides=[])
+
+
+def test_build_bid_response_requires_components():
+    with pytest.raises(ValueError):
+        build_bid_response([], [])
+
+
+def test_append_uses_encoded_tag():
+    msg = AllocationInstructionAck("A1", dt.date(2020, 1, 2), 0)
+    msg.append(FixTag.Text, "hello")
+    assert msg.get(FixTag.Text) == "hello"
+    assert str(msg).endswith("58=hello")
+
+
+def test_append_rejects_unknown_tag():
+    msg = AllocationInstructionAck("A1", dt.date(2020, 1, 2), 0)
+    with pytest.raises(ValueError):
+        msg.append(FixTag.Symbol, "AAPL")
+
+
+def test_get_validates_by_field_type():
+    msg = AllocationInstructionAck("A1", dt.date(2020, 1, 2), 3)
+    assert msg.get(FixTag.AllocStatus) == 3
+    assert msg.get(FixTag.TradeDate) == dt.date(2020, 1, 2)
+    assert msg.get(FixTag.Text) is None
+
+
+def test_get_missing_required_field_raises():
+    msg = AllocationInstructionAck("A1", dt.date(2020, 1, 2), 3)
+    msg.remove(FixTag.AllocID)
+    with pytest.raises(ValueError):
+        msg.get(FixTag.AllocID)
+
+
+def test_append_data_field_sets_length():
+    msg = AllocationInstructionAck("A1", dt.date(2020, 1, 2), 3)
+    msg.append(FixTag.EncodedText, "h\u00e9llo")
+    assert msg.get(FixTag.EncodedText) == "h\u00e9llo"
+    assert msg.get(FixTag.EncodedTextLen) == 6
+    assert msg._msg.pairs[-2:] == [
+        (b"354", b"6"), (b"355", "h\u00e9llo".encode())
+    ]
+
+    with pytest.raises(ValueError):
+        msg.append(FixTag.EncodedTextLen, 6)
+
+
+def test_append_checks_value_type():
+    msg = AllocationInstructionAck("A1", dt.date(2020, 1, 2), 3)
+    with pytest.raises(TypeError):
+        msg.append(FixTag.AllocRejCode, "1")
+
+
+def test_messages_have_no_instance_dict():
+    msg = AllocationInstructionAck("A1", dt.date(2020, 1, 2), 3)
+    assert not hasattr(msg, "__dict__")
+
+
+def test_append_type_check_can_be_disabled(monkeypatch):
+    monkeypatch.setattr(validate, "VALIDATE_APPEND", False)
+    msg = AllocationInstructionAck("A1", dt.date(2020, 1, 2), 3)
+    msg.append(FixTag.AllocRejCode, "1")
+    assert msg.get(FixTag.AllocRejCode) == 1
+
+
+@pytest.mark.parametrize("validate_append", [True, False])
+def test_append_none_leaves_field_unset(monkeypatch, validate_append):
+    monkeypatch.setattr(validate, "VALIDATE_APPEND", validate_append)
+    msg = AllocationInstructionAck("A1", dt.date(2020, 1, 2), 3)
+    expected = str(msg)
+    msg.append(FixTag.Text, None)
+    msg.append(FixTag.AllocRejCode, None)
+    msg.append(FixTag.EncodedText, None)
+    assert str(msg) == expected
+
+
+def test_cast():
+    msg = AllocationInstructionAck("A1", dt.date(2020, 1, 2), 3)
+    assert AllocationInstructionAck.cast(msg) is msg
+
+    msg.append_pair(8, "FIX.4.2", header=True)
+    base = FixMessage.from_raw(msg.encode())
+    casted = AllocationInstructionAck.cast(base)
+    assert isinstance(casted, AllocationInstructionAck)
+    assert casted.get(FixTag.AllocID) == "A1"
+
+    with pytest.raises(ValueError):
+        AllocationInstructionAck.cast(FixMessage())
+
+
+def test_constructor_appends_required_fields_in_order():
+    msg = ExecutionReport(
+        "O1", "E1", "0", "F", "2", "AAPL", "1",
+        Decimal("0"), Decimal("100"), Decimal("101.25"),
+    )
+    assert str(msg) == (
+        "35=8|37=O1|17=E1|20=0|150=F|39=2|55=AAPL|54=1"
+        "|151=0|14=100|6=101.25"
+    )
+    assert msg.msg_type == "8"
+    assert msg.get(FixTag.AvgPx) == Decimal("101.25")
+
+
+def test_convert_dates_and_timestamps():
+    ts = dt.datetime(2020, 1, 2, 3, 4, 5, 6789)
+    assert validate.convert("UTCTIMESTAMP", ts) == "20200102-03:04:05.006789"
+    assert validate.convert("LOCALMKTDATE", ts.date()) == "20200102"
+    assert validate.validate("UTCTIMESTAMP", "20200102-03:04:05.006789") == ts
+
+
+def test_convert_decimal_never_uses_exponent():
+    assert validate.convert("AMT", Decimal("101.25")) == "101.25"
+    assert validate.convert("PRICE", Decimal("1E+2")) == "100"
+    assert validate.convert("QTY", Decimal("-1E-8")) == "-0.00000001"
+
+
+def test_encode_matches_simplefix():
+    msg = ExecutionReport(
+        "O1", "E1", "0", "F", "2", "AAPL", "1",
+        Decimal("0"), Decimal("100"), Decimal("101.25"),
+    )
+    msg.append_pair(8, "FIX.4.2", header=True)
+    msg.append_pair(34, 12, header=True)
+    msg.append(FixTag.Text, "filled")
+    assert msg.encode() == msg._msg.encode()
+
+    with pytest.raises(ValueError):
+        FixMessage().encode()
+
+
+def test_validate_day_of_month_raises_value_error():
+    assert validate.validate("DAYOFMONTH", "31") == 31
+    with pytest.raises(ValueError):
+        validate.validate("DAYOFMONTH", "32")
+
+
+def test_append_pair_matches_simplefix():
+    import simplefix
+
+    pairs = [
+        (8, "FIX.4.2", True),
+        (FixTag.MsgType, "D", False),
+        (FixTag.Text, "hello", False),
+        ("58", 12, False),
+        (FixTag.MsgSeqNum, 3, True),
+        (9999, "custom", False),
+        (FixTag.Text, None, False),
+    ]
+    msg = FixMessage()
+    expected = simplefix.FixMessage()
+    for tag, val, header in pairs:
+        msg.append_pair(tag, val, header=header)
+        expected.append_pair(tag, val, header=header)
+    assert msg._msg.pairs == expected.pairs
+    assert msg.encode() == expected.encode()
+
+
+def test_appenders_are_shared_between_messages():
+    from fixtrate.fix42 import bid_response, execution_report
+
+    assert (
+        execution_report._APPENDERS[FixTag.Text]
+        is bid_response._APPENDERS[FixTag.Text]
+    )